@@ -1,13 +1,17 @@
-import os, re, datetime
+import os, re, sys, html, datetime
 import shutil
+import base64, contextlib, csv, io, json, gzip, hashlib, secrets, sqlite3, tempfile, threading, time, contextvars, fnmatch, mimetypes
+from collections import OrderedDict, Counter
 from pathlib import Path
 
 from fastapi import FastAPI, Request, Form, Depends, HTTPException, UploadFile, File
-from fastapi.responses import RedirectResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import RedirectResponse, Response, PlainTextResponse, JSONResponse, StreamingResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
+from starlette.staticfiles import NotModifiedResponse
+from starlette.datastructures import Headers
 from starlette.middleware.sessions import SessionMiddleware
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import create_engine, event, Column, Integer, String, Text, Boolean, DateTime, or_, and_, text, select, insert, update, bindparam, func
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 # --- Paths & Config ---
@@ -20,13 +24,14 @@ ROOT_DIR = API_DIR.parent                       # repo root
 SITE_DIR = ROOT_DIR
 
 SEED_DB     = ROOT_DIR / "assets" / "data" / "app.db"
-RUNTIME_DB  = Path("/tmp/app.db")
+RUNTIME_DB  = Path(os.environ.get("RUNTIME_DB", "/tmp/app.db"))
 
-use_runtime = os.access("/tmp", os.W_OK)
+# LAZY_STARTUP=0 restores the old behaviour of doing all setup at import time
+LAZY_STARTUP = os.environ.get("LAZY_STARTUP", "1") != "0"
+
+use_runtime = os.access(RUNTIME_DB.parent, os.W_OK)
 if use_runtime:
-    if SEED_DB.exists() and not RUNTIME_DB.exists():
-        RUNTIME_DB.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copyfile(SEED_DB, RUNTIME_DB)
+    # the seed is copied on first write (or first read, if it is not current)
     DB_PATH = RUNTIME_DB
 else:
     DB_DIR = ROOT_DIR / "assets" / "data"
@@ -38,12 +43,63 @@ SECRET_KEY = os.environ.get("SECRET_KEY", "change-this-secret-key")
 ADMIN_USER = os.environ.get("ADMIN_USER", "admin")
 ADMIN_PASSWORD = os.environ.get("ADMIN_PASSWORD", "admin123")
 
-from fastapi.templating import Jinja2Templates
-templates = Jinja2Templates(directory=str(ROOT_DIR / "templates"))
+# Jinja2 is imported and the environment built on the first template render,
+# so public JSON requests on a cold start never pay for it.
+class _LazyTemplates:
+    _real = None
+
+    def __getattr__(self, name):
+        if _LazyTemplates._real is None:
+            from fastapi.templating import Jinja2Templates
+            _LazyTemplates._real = Jinja2Templates(directory=str(ROOT_DIR / "templates"))
+            _LazyTemplates._real.env.globals["asset_url"] = asset_url
+            _LazyTemplates._real.env.globals["export_on_write"] = EXPORT_ON_WRITE
+        return getattr(_LazyTemplates._real, name)
+
+templates = _LazyTemplates()
+
+@contextlib.asynccontextmanager
+async def _lifespan(app):
+    yield
+    await dispose_async_engines()
 
+app = FastAPI(lifespan=_lifespan)
+app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY)
 
-engine = create_engine(f"sqlite:///{DB_PATH}", connect_args={"check_same_thread": False})
+# --- Storage ---
+# DB_JOURNAL_MODE=wal lets the public readers keep reading while an admin write
+# is in flight; set it to "delete" for the classic rollback journal.
+DB_JOURNAL_MODE = os.environ.get("DB_JOURNAL_MODE", "wal")
+DB_SYNCHRONOUS = os.environ.get("DB_SYNCHRONOUS", "normal")
+DB_CACHE_KB = int(os.environ.get("DB_CACHE_KB", "8192"))
+DB_MMAP_BYTES = int(os.environ.get("DB_MMAP_BYTES", str(64 * 1024 * 1024)))
+DB_BUSY_TIMEOUT_MS = int(os.environ.get("DB_BUSY_TIMEOUT_MS", "5000"))
+DB_READ_POOL = int(os.environ.get("DB_READ_POOL", "8"))
+
+def _sqlite_pragmas(readonly: bool):
+    def on_connect(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        cur.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
+        if not readonly:
+            cur.execute(f"PRAGMA journal_mode = {DB_JOURNAL_MODE}")
+        cur.execute(f"PRAGMA synchronous = {DB_SYNCHRONOUS}")
+        cur.execute(f"PRAGMA cache_size = -{DB_CACHE_KB}")
+        cur.execute(f"PRAGMA mmap_size = {DB_MMAP_BYTES}")
+        cur.execute("PRAGMA temp_store = MEMORY")
+        if readonly:
+            cur.execute("PRAGMA query_only = 1")
+        cur.close()
+    return on_connect
+
+# one pooled connection => admin writes are serialized in-process
+engine = create_engine(f"sqlite:///{DB_PATH}", connect_args={"check_same_thread": False},
+                       pool_size=1, max_overflow=0, pool_timeout=30)
+read_engine = create_engine(f"sqlite:///{DB_PATH}", connect_args={"check_same_thread": False},
+                            pool_size=DB_READ_POOL, max_overflow=DB_READ_POOL)
+event.listen(engine, "connect", _sqlite_pragmas(readonly=False))
+event.listen(read_engine, "connect", _sqlite_pragmas(readonly=True))
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+ReadSessionLocal = sessionmaker(bind=read_engine, autoflush=False, autocommit=False)
 Base = declarative_base()
 
 # --- Models ---
@@ -62,6 +118,7 @@ class Software(Base):
     payment_link_onetime = Column(Text, nullable=True)
     payment_link_yearly = Column(Text, nullable=True)
     image = Column(Text, nullable=True)
+    image_variants = Column(Text, nullable=True)  # JSON list, see _build_variants
     sort_order = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow)
@@ -97,49 +154,481 @@ class Client(Base):
     city = Column(String(120), nullable=True)
     website = Column(String(250), nullable=True)
     image = Column(Text, nullable=True)
+    image_variants = Column(Text, nullable=True)
     sort_order = Column(Integer, default=0)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow)
 
-Base.metadata.create_all(bind=engine)
-
-# ensure tables exist (idempotent)
-with engine.connect() as conn:
-    conn.exec_driver_sql("""
-    CREATE TABLE IF NOT EXISTS known_issues (
-        id INTEGER PRIMARY KEY,
-        title TEXT NOT NULL,
-        status TEXT,
-        content TEXT,
-        sort_order INTEGER DEFAULT 0,
-        is_active INTEGER DEFAULT 1,
-        created_at TEXT,
-        updated_at TEXT
-    )""")
-    cols = [r[1] for r in conn.exec_driver_sql("PRAGMA table_info('software')").fetchall()]
-    if 'image' not in cols:
-        conn.exec_driver_sql("ALTER TABLE software ADD COLUMN image TEXT")
-    conn.exec_driver_sql("""
-    CREATE TABLE IF NOT EXISTS release_notes (
-        id INTEGER PRIMARY KEY,
-        title TEXT NOT NULL,
-        version TEXT,
-        software_id INTEGER,
-        release_date TEXT,
-        content TEXT,
-        is_published INTEGER DEFAULT 1,
-        created_at TEXT,
-        updated_at TEXT
-    )""")
+class Job(Base):
+    __tablename__ = "jobs"
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(50), nullable=False)
+    key = Column(String(200), nullable=True)  # idempotency key: at most one queued job per key
+    payload = Column(Text, nullable=True)     # JSON keyword arguments
+    status = Column(String(20), nullable=False, default="queued")  # queued, running, done, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+class Tombstone(Base):
+    __tablename__ = "tombstones"
+    id = Column(Integer, primary_key=True)
+    table_name = Column(String(50), nullable=False)
+    row_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
+
+# --- Schema migrations ---
+# Each entry is (version, steps); a step is SQL text or a callable taking the
+# connection. Applied versions are recorded in schema_version, so every step
+# runs once per database, and the latest one in PRAGMA user_version, which is
+# the fingerprint checked at startup. Schema changes must go through here.
+def _add_column(table, column, ddl):
+    def step(conn):
+        cols = [r[1] for r in conn.exec_driver_sql(f"PRAGMA table_info('{table}')").fetchall()]
+        if column not in cols:
+            conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+    return step
+
+def _fts_steps(table, cols):
+    # external-content FTS5 index over `cols`, kept in sync by triggers
+    fts, c = f"{table}_fts", ", ".join(cols)
+    new, old = ", ".join(f"new.{x}" for x in cols), ", ".join(f"old.{x}" for x in cols)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({c}, content='{table}', "
+        f"content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {c}) VALUES (new.id, {new}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {c}) VALUES ('delete', old.id, {old}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {c} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {c}) VALUES ('delete', old.id, {old}); "
+        f"INSERT INTO {fts}(rowid, {c}) VALUES (new.id, {new}); END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+def _facet_steps(table, facet_table, cols, active="is_active"):
+    # per-column value counts over active rows, maintained by triggers
+    def bump(ref, delta):
+        return "".join(
+            f"INSERT INTO {facet_table} (facet, value, count) SELECT '{c}', {ref}.{c}, {delta} "
+            f"WHERE {ref}.{c} IS NOT NULL AND {ref}.{active} "
+            f"ON CONFLICT (facet, value) DO UPDATE SET count = count + {delta}; " for c in cols)
+    prune = f"DELETE FROM {facet_table} WHERE count <= 0; "
+    backfill = " UNION ALL ".join(
+        f"SELECT '{c}', {c}, count(*) FROM {table} WHERE {c} IS NOT NULL AND {active} GROUP BY {c}" for c in cols)
+    return [
+        f"CREATE TABLE IF NOT EXISTS {facet_table} (facet TEXT NOT NULL, value TEXT NOT NULL, "
+        f"count INTEGER NOT NULL, PRIMARY KEY (facet, value)) WITHOUT ROWID",
+        f"CREATE TRIGGER IF NOT EXISTS {facet_table}_ai AFTER INSERT ON {table} BEGIN {bump('new', 1)}END",
+        f"CREATE TRIGGER IF NOT EXISTS {facet_table}_ad AFTER DELETE ON {table} BEGIN {bump('old', -1)}{prune}END",
+        f"CREATE TRIGGER IF NOT EXISTS {facet_table}_au AFTER UPDATE OF {', '.join(cols)}, {active} ON {table} "
+        f"BEGIN {bump('old', -1)}{bump('new', 1)}{prune}END",
+        f"DELETE FROM {facet_table}",
+        f"INSERT INTO {facet_table} (facet, value, count) {backfill}",
+    ]
+
+def _gen_steps(tables):
+    # a per-table write counter bumped by every statement from any process,
+    # which is what the feed cache validates against
+    steps = ["CREATE TABLE IF NOT EXISTS table_gen (name TEXT PRIMARY KEY, gen INTEGER NOT NULL DEFAULT 0) WITHOUT ROWID"]
+    for t in tables:
+        steps.append(f"INSERT OR IGNORE INTO table_gen (name, gen) VALUES ('{t}', 0)")
+        steps += [f"CREATE TRIGGER IF NOT EXISTS {t}_gen_{op[0].lower()} AFTER {op} ON {t} BEGIN "
+                  f"UPDATE table_gen SET gen = gen + 1 WHERE name = '{t}'; END" for op in ("INSERT", "UPDATE", "DELETE")]
+    return steps
+
+MIGRATIONS = [
+    (1, [
+        """CREATE TABLE IF NOT EXISTS known_issues (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            status TEXT,
+            content TEXT,
+            sort_order INTEGER DEFAULT 0,
+            is_active INTEGER DEFAULT 1,
+            created_at TEXT,
+            updated_at TEXT
+        )""",
+        _add_column("software", "image", "TEXT"),
+        """CREATE TABLE IF NOT EXISTS release_notes (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            version TEXT,
+            software_id INTEGER,
+            release_date TEXT,
+            content TEXT,
+            is_published INTEGER DEFAULT 1,
+            created_at TEXT,
+            updated_at TEXT
+        )""",
+    ]),
+    # indexes matching the ORDER BY / WHERE of the list queries
+    (2, [
+        "CREATE INDEX IF NOT EXISTS ix_software_sort ON software (sort_order, id)",
+        "CREATE INDEX IF NOT EXISTS ix_release_notes_date ON release_notes (release_date DESC, id DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_release_notes_published ON release_notes (is_published, release_date DESC, id DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_release_notes_software ON release_notes (software_id, is_published, release_date DESC, id DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_known_issues_active ON known_issues (is_active, sort_order, id DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_clients_sort ON clients (sort_order, id DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_clients_active ON clients (is_active, sort_order, id DESC)",
+        "ANALYZE",
+    ]),
+    (3, [
+        _add_column("software", "image_variants", "TEXT"),
+        _add_column("clients", "image_variants", "TEXT"),
+    ]),
+    (4, _fts_steps("software", ("name", "description", "category"))
+        + _fts_steps("release_notes", ("title", "version", "content"))
+        + _fts_steps("known_issues", ("title", "content"))),
+    # the jobs table itself comes from the model via create_all
+    (5, [
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_jobs_queued_key ON jobs (key) WHERE status = 'queued'",
+        "CREATE INDEX IF NOT EXISTS ix_jobs_status_run_at ON jobs (status, run_at)",
+    ]),
+    (6, _facet_steps("clients", "client_facets", ("industry", "city"))),
+    # keyset order of the delta feeds; the tombstones table comes from the model
+    (7, [
+        *(f"UPDATE {t} SET updated_at = coalesce(created_at, strftime('%Y-%m-%d %H:%M:%f000', 'now')) "
+          f"WHERE updated_at IS NULL" for t in ("software", "release_notes", "known_issues")),
+        "CREATE INDEX IF NOT EXISTS ix_software_updated ON software (updated_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_release_notes_updated ON release_notes (updated_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_known_issues_updated ON known_issues (updated_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_tombstones_table ON tombstones (table_name, deleted_at, row_id)",
+    ]),
+    # release deltas carry software_name, so a rename changes the software's releases too
+    (8, [
+        "CREATE TRIGGER IF NOT EXISTS software_rename_au AFTER UPDATE OF name ON software "
+        "WHEN old.name IS NOT new.name BEGIN "
+        "UPDATE release_notes SET updated_at = new.updated_at WHERE software_id = new.id; END",
+    ]),
+    (9, _gen_steps(("software", "release_notes", "known_issues", "clients"))),
+]
+
+def _migrate(bind):
+    with bind.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE IF NOT EXISTS schema_version (version INTEGER PRIMARY KEY, applied_at TEXT)")
+        done = {r[0] for r in conn.exec_driver_sql("SELECT version FROM schema_version").fetchall()}
+        for version, steps in MIGRATIONS:
+            if version in done:
+                continue
+            for step in steps:
+                if callable(step):
+                    step(conn)
+                else:
+                    conn.exec_driver_sql(step)
+            conn.exec_driver_sql("INSERT OR IGNORE INTO schema_version (version, applied_at) VALUES (?, ?)",
+                                 (version, datetime.datetime.utcnow().isoformat()))
+        conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+def _user_version(bind) -> int:
+    with bind.connect() as conn:
+        return conn.exec_driver_sql("PRAGMA user_version").scalar() or 0
+
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+def _ensure_schema():
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if _schema_ready:
+            return
+        if DB_PATH == RUNTIME_DB and SEED_DB.exists() and not RUNTIME_DB.exists():
+            RUNTIME_DB.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(SEED_DB, RUNTIME_DB)
+        # a database stamped with the current version needs no DDL at all
+        if _user_version(engine) != SCHEMA_VERSION:
+            Base.metadata.create_all(bind=engine)
+            _migrate(engine)
+        _schema_ready = True
+    _start_job_workers()  # picks up jobs left over from a previous process
+
+# Until the first admin write creates the runtime copy, public reads go straight
+# to the bundled seed, opened read-only and immutable (no locks, no copy).
+_SeedSessionLocal = None
+_seed_ok = None
+
+def _seed_current() -> bool:
+    global _SeedSessionLocal, _seed_ok
+    if _seed_ok is None:
+        try:
+            eng = create_engine(f"sqlite:///file:{SEED_DB}?mode=ro&immutable=1&uri=true",
+                                connect_args={"check_same_thread": False})
+            _seed_ok = SEED_DB.exists() and _user_version(eng) == SCHEMA_VERSION
+            if _seed_ok:
+                _SeedSessionLocal = sessionmaker(bind=eng, autoflush=False, autocommit=False)
+        except Exception:
+            _seed_ok = False
+    return _seed_ok
+
+def _use_seed() -> bool:
+    return not _schema_ready and DB_PATH == RUNTIME_DB and not RUNTIME_DB.exists() and _seed_current()
 
 def get_db():
+    _ensure_schema()
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
+def _read_session():
+    if _use_seed():
+        return _SeedSessionLocal()
+    _ensure_schema()
+    return ReadSessionLocal()
+
+def get_read_db():
+    db = _read_session()
+    try:
+        yield db
+    finally:
+        db.close()
+
+# --- Async reads ---
+# The public /api/*.json routes run on the event loop against sqlite+aiosqlite,
+# so concurrent readers are not capped by the threadpool. Without aiosqlite (or
+# with ASYNC_DB=0) the same routes fall back to sync sessions in the threadpool.
+try:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+    import aiosqlite  # noqa: F401
+except ImportError:
+    AsyncSession = None
+
+ASYNC_DB = AsyncSession is not None and os.environ.get("ASYNC_DB", "1") == "1"
+AsyncReadSessionLocal = None
+_AsyncSeedSessionLocal = None
+
+if ASYNC_DB:
+    async_read_engine = create_async_engine(f"sqlite+aiosqlite:///{DB_PATH}",
+                                            pool_size=DB_READ_POOL, max_overflow=DB_READ_POOL)
+    event.listen(async_read_engine.sync_engine, "connect", _sqlite_pragmas(readonly=True))
+    AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False)
+
+async def dispose_async_engines():
+    for maker in (AsyncReadSessionLocal, _AsyncSeedSessionLocal):
+        if maker is not None:
+            await maker.kw["bind"].dispose()
+
+async def get_async_read_db():
+    global _AsyncSeedSessionLocal
+    if not ASYNC_DB:
+        db = await run_in_threadpool(_read_session)
+        try:
+            yield db
+        finally:
+            db.close()
+        return
+    if _use_seed():
+        if _AsyncSeedSessionLocal is None:
+            eng = create_async_engine(f"sqlite+aiosqlite:///file:{SEED_DB}?mode=ro&immutable=1&uri=true")
+            _AsyncSeedSessionLocal = async_sessionmaker(eng, autoflush=False)
+        maker = _AsyncSeedSessionLocal
+    else:
+        if not _schema_ready:
+            await run_in_threadpool(_ensure_schema)
+        maker = AsyncReadSessionLocal
+    async with maker() as db:
+        yield db
+
+# --- Instrumentation ---
+# Per-request timing and SQL accounting. Every SQL statement on any engine is
+# timed by engine events and charged to the request in the current context
+# (run_in_threadpool and AsyncSession both carry the context along); work on
+# background threads is charged to "background". Responses get a
+# Server-Timing header, /metrics serves Prometheus text, and PROFILE_MS turns
+# on profiling of requests slower than that many milliseconds.
+from sqlalchemy.engine import Engine
+
+SERVER_TIMING = os.environ.get("SERVER_TIMING", "1") == "1"
+SLOW_QUERY_MS = float(os.environ.get("SLOW_QUERY_MS", "250"))
+N_PLUS_ONE = int(os.environ.get("N_PLUS_ONE", "10"))  # same statement this often in one request
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+PROFILE_MS = float(os.environ.get("PROFILE_MS", "0"))
+PROFILE_DIR = Path(os.environ.get("PROFILE_DIR", "/tmp/profiles"))
+_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_req_stats = contextvars.ContextVar("req_stats", default=None)
+_metrics_lock = threading.Lock()
+_req_hist = {}      # (method, route) -> [bucket counts..., +Inf count, sum seconds]
+_req_total = Counter()   # (method, route, status)
+_sql_total = Counter()   # route -> statements
+_sql_seconds = Counter() # route -> seconds
+_n_plus_one = Counter()  # route -> flagged requests
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _sql_start(conn, cursor, statement, parameters, context, executemany):
+    # one value per connection, overwritten by the next statement: a statement
+    # that raises never reaches after_cursor_execute, and must not leave a trace
+    conn.info["_sql_t0"] = time.perf_counter()
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _sql_end(conn, cursor, statement, parameters, context, executemany):
+    t0 = conn.info.pop("_sql_t0", None)
+    if t0 is None:
+        return
+    elapsed = time.perf_counter() - t0
+    stats = _req_stats.get()
+    if stats is None:
+        with _metrics_lock:
+            _sql_total["background"] += 1
+            _sql_seconds["background"] += elapsed
+    else:
+        stats["sql"] += 1
+        stats["sql_s"] += elapsed
+        stats["statements"][statement] += 1
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        print(f"slow query {elapsed * 1000:.1f}ms: {' '.join(statement.split())[:500]}", file=sys.stderr)
+
+def _route_label(scope) -> str:
+    route = scope.get("route")
+    if route is not None:
+        return route.path_format
+    if scope.get("endpoint") is not None:  # a Mount, e.g. the static files
+        return f"mount:{scope.get('root_path') or '/'}"
+    return "unmatched"
+
+class _Profiler:
+    # one request at a time: cProfile cannot nest and the reports are for spot checks
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.active = PROFILE_MS > 0 and self._lock.acquire(blocking=False)
+        self.prof = None
+        if not self.active:
+            return
+        try:
+            from pyinstrument import Profiler
+            self.prof = Profiler(async_mode="enabled")
+        except ImportError:
+            import cProfile
+            self.prof = cProfile.Profile()
+        if hasattr(self.prof, "start"):
+            self.prof.start()
+        else:
+            self.prof.enable()
+
+    def finish(self, method: str, route: str, elapsed_ms: float):
+        if not self.active:
+            return
+        try:
+            if hasattr(self.prof, "stop"):
+                self.prof.stop()
+            else:
+                self.prof.disable()
+            if elapsed_ms < PROFILE_MS:
+                return
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            name = re.sub(r"[^A-Za-z0-9]+", "_", route).strip("_") or "root"
+            base = PROFILE_DIR / f"{int(time.time() * 1000)}-{method}-{name}-{elapsed_ms:.0f}ms"
+            if hasattr(self.prof, "output_html"):
+                base.with_suffix(".html").write_text(self.prof.output_html())
+            else:
+                self.prof.dump_stats(str(base.with_suffix(".prof")))
+        except Exception as e:
+            print(f"profile failed: {e}", file=sys.stderr)
+        finally:
+            self._lock.release()
+
+class _Metrics:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        stats = {"sql": 0, "sql_s": 0.0, "statements": Counter()}
+        token = _req_stats.set(stats)
+        profiler = _Profiler()
+        t0 = time.perf_counter()
+        status = 500
+
+        async def timed_send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if SERVER_TIMING:
+                    app_ms = (time.perf_counter() - t0) * 1000
+                    value = (f'app;dur={app_ms:.1f}, db;dur={stats["sql_s"] * 1000:.1f};'
+                             f'desc="{stats["sql"]} queries"')
+                    message = dict(message, headers=list(message.get("headers", [])) +
+                                   [(b"server-timing", value.encode())])
+            await send(message)
+        try:
+            await self.app(scope, receive, timed_send)
+        finally:
+            _req_stats.reset(token)
+            elapsed = time.perf_counter() - t0
+            method, route = scope["method"], _route_label(scope)
+            repeated = [(sql, n) for sql, n in stats["statements"].items() if n >= N_PLUS_ONE]
+            with _metrics_lock:
+                hist = _req_hist.setdefault((method, route), [0] * (len(_BUCKETS) + 2))
+                for i, le in enumerate(_BUCKETS):
+                    if elapsed <= le:
+                        hist[i] += 1
+                hist[-2] += 1
+                hist[-1] += elapsed
+                _req_total[(method, route, status)] += 1
+                _sql_total[route] += stats["sql"]
+                _sql_seconds[route] += stats["sql_s"]
+                if repeated:
+                    _n_plus_one[route] += 1
+            for sql, n in repeated:
+                print(f"possible N+1 on {method} {route}: {n}x {' '.join(sql.split())[:300]}", file=sys.stderr)
+            profiler.finish(method, route, elapsed * 1000)
+
+app.add_middleware(_Metrics)
+
+def _prom_labels(**labels) -> str:
+    return ",".join(f'{k}="{str(v).replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"'
+                    for k, v in labels.items())
+
+@app.get("/metrics")
+def metrics(request: Request):
+    if METRICS_TOKEN and not secrets.compare_digest(request.headers.get("authorization", ""),
+                                                    f"Bearer {METRICS_TOKEN}"):
+        raise HTTPException(401)
+    out = []
+    with _metrics_lock:
+        out += ["# HELP app_request_duration_seconds Request latency by route.",
+                "# TYPE app_request_duration_seconds histogram"]
+        for (method, route), hist in sorted(_req_hist.items()):
+            lbl = _prom_labels(method=method, route=route)
+            for le, n in zip(_BUCKETS, hist):
+                out.append(f'app_request_duration_seconds_bucket{{{lbl},le="{le}"}} {n}')
+            out.append(f'app_request_duration_seconds_bucket{{{lbl},le="+Inf"}} {hist[-2]}')
+            out.append(f"app_request_duration_seconds_count{{{lbl}}} {hist[-2]}")
+            out.append(f"app_request_duration_seconds_sum{{{lbl}}} {hist[-1]:.6f}")
+        out += ["# HELP app_requests_total Requests by route and status.", "# TYPE app_requests_total counter"]
+        for (method, route, status), n in sorted(_req_total.items()):
+            out.append(f"app_requests_total{{{_prom_labels(method=method, route=route, status=status)}}} {n}")
+        out += ["# HELP app_sql_statements_total SQL statements executed, by route.",
+                "# TYPE app_sql_statements_total counter"]
+        out += [f"app_sql_statements_total{{{_prom_labels(route=r)}}} {n}" for r, n in sorted(_sql_total.items())]
+        out += ["# HELP app_sql_seconds_total Time spent in SQL, by route.", "# TYPE app_sql_seconds_total counter"]
+        out += [f"app_sql_seconds_total{{{_prom_labels(route=r)}}} {n:.6f}" for r, n in sorted(_sql_seconds.items())]
+        out += ["# HELP app_n_plus_one_total Requests that repeated one statement N_PLUS_ONE times or more.",
+                "# TYPE app_n_plus_one_total counter"]
+        out += [f"app_n_plus_one_total{{{_prom_labels(route=r)}}} {n}" for r, n in sorted(_n_plus_one.items())]
+    out += ["# HELP app_feed_cache_entries Cached public feed responses.", "# TYPE app_feed_cache_entries gauge",
+            f"app_feed_cache_entries {len(_feed_cache)}",
+            "# HELP app_feed_cache_bytes Size of the cached public feed responses.", "# TYPE app_feed_cache_bytes gauge",
+            f"app_feed_cache_bytes {_feed_cache_bytes}"]
+    if _schema_ready:
+        with jobs_engine.connect() as conn:
+            counts = dict(conn.execute(select(Job.status, func.count()).group_by(Job.status)).all())
+        out += ["# HELP app_jobs Background jobs by status.", "# TYPE app_jobs gauge"]
+        out += [f"app_jobs{{{_prom_labels(status=st)}}} {counts.get(st, 0)}" for st in ("queued", "running", "done", "failed")]
+    return PlainTextResponse("\n".join(out) + "\n", media_type="text/plain; version=0.0.4")
+
 def is_logged_in(request: Request) -> bool:
     return bool(request.session.get("admin_ok"))
 
@@ -155,7 +644,51 @@ def _to_int(val):
     except Exception:
         return None
 
-def _save_upload(file: UploadFile | None) -> str | None:
+# --- Uploads ---
+# Uploads are copied in fixed-size chunks into a temp file next to their final
+# location while being hashed, then renamed into place, so memory stays flat no
+# matter how large or how many uploads are in flight.
+UPLOAD_MAX_BYTES = int(os.environ.get("UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))
+UPLOAD_CHUNK = 1024 * 1024
+UPLOAD_FORM_OVERHEAD = 64 * 1024  # room for the other form fields
+BULK_MAX_BYTES = int(os.environ.get("BULK_MAX_BYTES", str(512 * 1024 * 1024)))
+
+class _UploadLimit:
+    # rejects oversized admin POST bodies before they are parsed: up front from
+    # Content-Length, or as soon as a chunked body crosses the limit
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not scope["path"].startswith("/admin/"):
+            return await self.app(scope, receive, send)
+        if scope["path"].startswith("/admin/bulk/"):
+            limit = BULK_MAX_BYTES
+        else:
+            limit = UPLOAD_MAX_BYTES + UPLOAD_FORM_OVERHEAD
+        length = dict(scope["headers"]).get(b"content-length", b"")
+        if length.isdigit() and int(length) > limit:
+            return await PlainTextResponse("Upload too large", status_code=413)(scope, receive, send)
+        seen = 0
+        async def limited_receive():
+            nonlocal seen
+            message = await receive()
+            if message["type"] == "http.request":
+                seen += len(message.get("body", b""))
+                if seen > limit:
+                    raise HTTPException(413, "Upload too large")
+            return message
+        await self.app(scope, limited_receive, send)
+
+app.add_middleware(_UploadLimit)
+
+def _exists(db, model, item_id: int) -> bool:
+    try:
+        return db.query(model.id).filter(model.id == item_id).first() is not None
+    finally:
+        db.rollback()  # don't hold the writer connection while an upload streams
+
+async def _save_upload(file: UploadFile | None) -> str | None:
     if not file:
         return None
     name = (file.filename or "").lower()
@@ -167,53 +700,705 @@ def _save_upload(file: UploadFile | None) -> str | None:
         return None
     up_dir = os.path.join(SITE_DIR, "assets", "uploads")
     os.makedirs(up_dir, exist_ok=True)
-    base = re.sub(r"[^a-z0-9_-]+", "-", os.path.splitext(os.path.basename(name))[0])
-    fname = f"{base}-{int(datetime.datetime.utcnow().timestamp())}{ext}"
-    path = os.path.join(up_dir, fname)
-    with open(path, "wb") as out:
-        out.write(file.file.read())
+    fd, tmp = tempfile.mkstemp(dir=up_dir, prefix=".upload-", suffix=ext)
+    h = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := await file.read(UPLOAD_CHUNK):
+                size += len(chunk)
+                if size > UPLOAD_MAX_BYTES:
+                    raise HTTPException(413, "Upload too large")
+                h.update(chunk)
+                await run_in_threadpool(out.write, chunk)
+        if size == 0:
+            os.remove(tmp)
+            return None
+        digest = h.hexdigest()[:16]
+        # same bytes => same file, whatever name it was uploaded under
+        for existing in Path(up_dir).glob(f"*-{digest}{ext}"):
+            os.remove(tmp)
+            return f"/assets/uploads/{existing.name}"
+        base = re.sub(r"[^a-z0-9_-]+", "-", os.path.splitext(os.path.basename(name))[0])
+        fname = f"{base}-{digest}{ext}"
+        os.replace(tmp, os.path.join(up_dir, fname))
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
     return f"/assets/uploads/{fname}"
 
-# --- Public APIs ---
-@app.get("/api/releases.json")
-def api_releases(db=Depends(get_db)):
-    items = db.query(ReleaseNote).order_by(ReleaseNote.release_date.desc(), ReleaseNote.id.desc()).all()
+# --- Image variants ---
+# Raster uploads get width-bounded WebP (and AVIF, when Pillow was built with
+# it) copies without metadata, encoded by a background job so the admin form
+# returns immediately. Variant names derive from the upload's content hash, so
+# an image uploaded twice is only encoded once.
+try:
+    from PIL import Image, ImageOps, features as pil_features
+except ImportError:
+    Image = None
+
+IMAGE_WIDTHS = tuple(int(w) for w in os.environ.get("IMAGE_WIDTHS", "320,640,1280").split(","))
+
+def _image_formats():
+    fmts = [("webp", "image/webp", {"quality": 80, "method": 6})]
+    if pil_features.check("avif"):
+        fmts.insert(0, ("avif", "image/avif", {"quality": 55}))
+    return fmts
+
+def _build_variants(url: str) -> list:
+    src = SITE_DIR / url.lstrip("/")
+    out_dir = src.parent / "variants"
+    out_dir.mkdir(parents=True, exist_ok=True)
     out = []
-    for x in items:
-        if not x.is_published:
-            continue
-        name = None
-        try:
-            if x.software_id:
-                s = db.query(Software).get(x.software_id)
-                name = s.name if s else None
-        except Exception:
-            name = None
-        out.append({
-            "id": x.id, "title": x.title, "version": x.version,
-            "software_id": x.software_id, "software_name": name,
-            "release_date": x.release_date.isoformat() if isinstance(x.release_date, datetime.datetime) else str(x.release_date),
-            "content": x.content,
-        })
-    return {"items": out}
+    with Image.open(src) as im:
+        im = ImageOps.exif_transpose(im)  # always a copy
+        im.info.clear()
+        if im.mode not in ("RGB", "RGBA"):
+            im = im.convert("RGBA" if im.mode in ("P", "LA", "PA") else "RGB")
+        for w in sorted({min(w, im.width) for w in IMAGE_WIDTHS}):
+            frame = im if w == im.width else im.resize((w, max(1, round(im.height * w / im.width))), Image.LANCZOS)
+            for ext, mime, opts in _image_formats():
+                dest = out_dir / f"{src.stem}-{w}w.{ext}"
+                if not dest.exists():
+                    tmp = dest.with_name(f"{dest.name}.{threading.get_ident()}.tmp")
+                    frame.save(tmp, format=ext.upper(), **opts)
+                    os.replace(tmp, dest)
+                out.append({"src": f"/assets/uploads/variants/{dest.name}", "width": w, "type": mime})
+    return out
 
-@app.get("/api/software.json")
-def api_software(db=Depends(get_db)):
-    items = db.query(Software).order_by(Software.sort_order, Software.id).all()
-    return {"items": [{
+def _store_variants(table: str, item_id: int, url: str):
+    variants = _build_variants(url)
+    model = {"software": Software, "clients": Client}[table]
+    db = SessionLocal()
+    try:
+        db.connection()  # take the writer before stamping updated_at
+        # the image may have been replaced while we were encoding
+        n = (db.query(model).filter(model.id == item_id, model.image == url)
+             .update({model.image_variants: json.dumps(variants), model.updated_at: datetime.datetime.utcnow()},
+                     synchronize_session=False))
+        db.commit()
+    finally:
+        db.close()
+    if n:
+        _touch(table)
+
+_pillow_warned = False
+
+def _queue_variants(table: str, item_id: int, url: str | None):
+    global _pillow_warned
+    if not url or not url.startswith("/assets/uploads/") or url.endswith(".svg"):
+        return
+    if Image is None:
+        if not _pillow_warned:
+            _pillow_warned = True
+            print("Pillow is not installed; uploaded images get no resized variants", file=sys.stderr)
+        return
+    _enqueue("variants", {"table": table, "item_id": item_id, "url": url}, key=f"variants:{table}:{item_id}:{url}")
+
+def _variants(x) -> list:
+    try:
+        return json.loads(x.image_variants) if x.image_variants else []
+    except ValueError:
+        return []
+
+# --- Feed cache ---
+# Public feeds are kept as pre-serialized JSON bytes per URL, tagged with the
+# generations (table_gen, bumped by triggers on every write, see migration 9)
+# of the tables they were built from. A hit costs one read of table_gen, so
+# writes from other workers or the CLI invalidate entries just like our own.
+FEED_CACHE_MAX = int(os.environ.get("FEED_CACHE_MAX", "256"))
+FEED_CACHE_MAX_BYTES = int(os.environ.get("FEED_CACHE_MAX_BYTES", str(128 * 1024 * 1024)))
+_feed_cache = OrderedDict()
+_feed_cache_bytes = 0
+_feed_lock = threading.Lock()
+_gen_conns = threading.local()
+
+def _touch(*tables):
+    # the cache notices writes through table_gen; what is left is the static export
+    _export_after_write()
+
+def _table_gens(tables) -> tuple:
+    # a private read-only connection per thread: reading table_gen takes a few
+    # microseconds, cheap enough for the event loop, where a pooled aiosqlite
+    # round trip would cost more than the cache hit it validates
+    seed = _use_seed()
+    conn = getattr(_gen_conns, "seed" if seed else "runtime", None)
+    if conn is None:
+        uri = f"file:{SEED_DB}?mode=ro&immutable=1" if seed else f"file:{DB_PATH}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        conn.execute(f"PRAGMA busy_timeout = {DB_BUSY_TIMEOUT_MS}")
+        setattr(_gen_conns, "seed" if seed else "runtime", conn)
+    gens = dict(conn.execute("SELECT name, gen FROM table_gen"))
+    return tuple(gens.get(t, 0) for t in tables)
+
+def _json_default(o):
+    return o.isoformat() if hasattr(o, "isoformat") else str(o)
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    inm = request.headers.get("if-none-match")
+    if not inm:
+        return False
+    if inm.strip() == "*":
+        return True
+    return etag in [t.strip().removeprefix("W/") for t in inm.split(",")]
+
+def _feed_bytes(payload) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"),
+                      default=_json_default).encode("utf-8")
+
+async def _cached_json(request: Request, params, tables, db, build):
+    # build(session) -> payload; only runs on a miss, and never in the event
+    # loop with a sync session. params are the validated arguments build uses,
+    # so query strings that differ only in unknown parameters share one entry.
+    global _feed_cache_bytes
+    key = (request.url.path, params)
+    gen = _table_gens(tables)
+    with _feed_lock:
+        hit = _feed_cache.get(key)
+        if hit:
+            _feed_cache.move_to_end(key)
+    if not hit or hit[0] != gen:
+        # gen is read before building, so a write that lands mid-build only
+        # causes one extra rebuild on the next hit, never a stale entry
+        if AsyncSession is not None and isinstance(db, AsyncSession):
+            body = await db.run_sync(lambda s: _feed_bytes(build(s)))
+        else:
+            body = await run_in_threadpool(lambda: _feed_bytes(build(db)))
+        hit = (gen, body, '"%s"' % hashlib.sha256(body).hexdigest()[:32])
+        with _feed_lock:
+            old = _feed_cache.pop(key, None)
+            if old:
+                _feed_cache_bytes -= len(old[1])
+            if len(body) <= FEED_CACHE_MAX_BYTES:
+                _feed_cache[key] = hit
+                _feed_cache_bytes += len(body)
+            while _feed_cache and (len(_feed_cache) > FEED_CACHE_MAX or _feed_cache_bytes > FEED_CACHE_MAX_BYTES):
+                _feed_cache_bytes -= len(_feed_cache.popitem(last=False)[1][1])
+    headers = {"ETag": hit[2], "Cache-Control": "no-cache"}
+    if _etag_matches(request, hit[2]):
+        return Response(status_code=304, headers=headers)
+    return Response(hit[1], media_type="application/json", headers=headers)
+
+# --- Public APIs ---
+RELEASES_PAGE_MAX = 500
+
+def _parse_dt(val):
+    try:
+        return datetime.datetime.fromisoformat(str(val).strip()) if val else None
+    except Exception:
+        return None
+
+# release cursors are "<release_date iso>~<id>" of the last row of a page
+def _release_cursor(dt, rid) -> str:
+    return f"{dt.isoformat() if isinstance(dt, datetime.datetime) else ''}~{rid}"
+
+def _parse_release_cursor(val):
+    d, sep, i = (val or "").rpartition("~")
+    if not sep or not i.isdigit():
+        return None
+    dt = _parse_dt(d)
+    if d and dt is None:
+        return None
+    return dt, int(i)
+
+def _releases_feed(db, software_id=None, since_dt=None, limit=None, cursor=None):
+    q = (db.query(ReleaseNote.id, ReleaseNote.title, ReleaseNote.version, ReleaseNote.software_id,
+                  Software.name.label("software_name"), ReleaseNote.release_date, ReleaseNote.content)
+         .outerjoin(Software, Software.id == ReleaseNote.software_id)
+         .filter(ReleaseNote.is_published == True))
+    if software_id is not None:
+        q = q.filter(ReleaseNote.software_id == software_id)
+    if since_dt is not None:
+        q = q.filter(ReleaseNote.release_date >= since_dt)
+    if cursor:
+        dt, rid = cursor
+        if dt is None:  # NULL dates sort last in DESC order
+            q = q.filter(ReleaseNote.release_date.is_(None), ReleaseNote.id < rid)
+        else:
+            q = q.filter(or_(ReleaseNote.release_date < dt,
+                             ReleaseNote.release_date.is_(None),
+                             and_(ReleaseNote.release_date == dt, ReleaseNote.id < rid)))
+    q = q.order_by(ReleaseNote.release_date.desc(), ReleaseNote.id.desc())
+    rows = q.limit(limit + 1).all() if limit else q.all()
+    nxt = None
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        nxt = _release_cursor(rows[-1].release_date, rows[-1].id)
+    return {"items": [_release_item(x) for x in rows], "next": nxt}
+
+def _release_item(x) -> dict:
+    return {
+        "id": x.id, "title": x.title, "version": x.version,
+        "software_id": x.software_id, "software_name": x.software_name,
+        "release_date": x.release_date.isoformat() if isinstance(x.release_date, datetime.datetime) else str(x.release_date),
+        "content": x.content,
+    }
+
+def _software_item(x) -> dict:
+    return {
         "id": x.id, "name": x.name, "slug": x.slug, "category": x.category,
         "description": x.description, "price_one_time": x.price_one_time,
         "price_yearly": x.price_yearly, "is_free": x.is_free, "is_active": x.is_active,
         "download_url": x.download_url, "payment_link_onetime": x.payment_link_onetime,
-        "payment_link_yearly": x.payment_link_yearly, "image": x.image, "sort_order": x.sort_order
-    } for x in items]}
+        "payment_link_yearly": x.payment_link_yearly, "image": x.image,
+        "image_variants": _variants(x), "sort_order": x.sort_order
+    }
+
+def _known_issue_item(x) -> dict:
+    return {"id": x.id, "title": x.title, "status": x.status or "Open", "content": x.content or ""}
+
+def _software_feed(db):
+    items = db.query(Software).order_by(Software.sort_order, Software.id).all()
+    return {"items": [_software_item(x) for x in items]}
+
+def _known_issues_feed(db):
+    items = (db.query(KnownIssue).filter(KnownIssue.is_active == True)
+             .order_by(KnownIssue.sort_order, KnownIssue.id.desc()).all())
+    return {"items": [_known_issue_item(x) for x in items]}
+
+CLIENT_FIELDS = ("id", "name", "industry", "city", "website", "image", "image_variants")
+_CLIENT_FACETS = ("industry", "city")
+
+def _client_facets(db) -> dict:
+    # counts over active clients, kept current by triggers (see migration 6)
+    out = {f: [] for f in _CLIENT_FACETS}
+    rows = db.execute(text("SELECT facet, value, count FROM client_facets ORDER BY facet, count DESC, value"))
+    for facet, value, count in rows:
+        if facet in out:
+            out[facet].append({"value": value, "count": count})
+    return out
+
+def _clients_feed(db, fields=CLIENT_FIELDS, industry=None, city=None):
+    query = db.query(*(getattr(Client, f) for f in fields)).filter(Client.is_active == True)
+    if industry:
+        query = query.filter(Client.industry == industry)
+    if city:
+        query = query.filter(Client.city == city)
+    items = query.order_by(Client.sort_order, Client.id.desc()).all()
+    return {"items": [{f: (_variants(x) if f == "image_variants" else getattr(x, f)) for f in fields}
+                      for x in items],
+            "facets": _client_facets(db)}
+
+@app.get("/api/releases.json")
+async def api_releases(request: Request, software_id: int | None = None, since: str | None = None,
+                       limit: int | None = None, after: str | None = None, db=Depends(get_async_read_db)):
+    since_dt = _parse_dt(since)
+    if since and since_dt is None:
+        raise HTTPException(400, "invalid since")
+    cursor = _parse_release_cursor(after) if after else None
+    if after and cursor is None:
+        raise HTTPException(400, "invalid cursor")
+    if limit is not None:
+        limit = max(1, min(limit, RELEASES_PAGE_MAX))
+    return await _cached_json(request, (software_id, since_dt, limit, cursor), ("release_notes", "software"), db,
+                              lambda s: _releases_feed(s, software_id, since_dt, limit, cursor))
+
+@app.get("/api/software.json")
+async def api_software(request: Request, db=Depends(get_async_read_db)):
+    return await _cached_json(request, (), ("software",), db, _software_feed)
 
 @app.get("/api/known_issues.json")
-def api_known_issues(db=Depends(get_db)):
-    items = db.query(KnownIssue).order_by(KnownIssue.sort_order, KnownIssue.id.desc()).all()
+async def api_known_issues(request: Request, db=Depends(get_async_read_db)):
+    return await _cached_json(request, (), ("known_issues",), db, _known_issues_feed)
+
+# --- Delta sync ---
+# Changes are read in (updated_at, table, id) order and handed out with a cursor
+# "<updated_at iso>~<table>~<id>" of the last change returned; a bare timestamp
+# also works as ?since= (changes at or after it). Deleted rows come from the
+# tombstones the delete handlers write. Rows that are hidden (unpublished
+# releases, inactive known issues) are reported as deleted too, so the delta
+# never carries anything the full feeds would not show. Writers stamp
+# updated_at while holding the single writer connection, so stamps follow
+# commit order and a cursor never gets ahead of a change still being written.
+CHANGES_PAGE_MAX = int(os.environ.get("CHANGES_PAGE_MAX", "1000"))
+
+def _release_rows(db):
+    return (db.query(ReleaseNote.id, ReleaseNote.title, ReleaseNote.version, ReleaseNote.software_id,
+                     Software.name.label("software_name"), ReleaseNote.release_date, ReleaseNote.content,
+                     ReleaseNote.is_published.label("visible"), ReleaseNote.updated_at)
+            .outerjoin(Software, Software.id == ReleaseNote.software_id))
+
+def _issue_rows(db):
+    return db.query(KnownIssue.id, KnownIssue.title, KnownIssue.status, KnownIssue.content,
+                    KnownIssue.is_active.label("visible"), KnownIssue.updated_at)
+
+# table -> (model, rows query, item builder returning None for hidden rows);
+# in sorted order, which is the order of tables within one updated_at
+_CHANGES = {
+    "known_issues": (KnownIssue, _issue_rows, lambda r: _known_issue_item(r) if r.visible else None),
+    "release_notes": (ReleaseNote, _release_rows, lambda r: _release_item(r) if r.visible else None),
+    "software": (Software, lambda db: db.query(Software), _software_item),
+}
+
+def _tombstone(db, table: str, row_id: int):
+    if table in _CHANGES:
+        db.add(Tombstone(table_name=table, row_id=row_id))
+
+def _parse_since(val):
+    ts, sep, rest = (val or "").partition("~")
+    dt = _parse_dt(ts)
+    if dt is None:
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    if not sep:
+        return dt, "", 0  # sorts before every change at dt
+    table, sep, rid = rest.partition("~")
+    if table not in _CHANGES or not rid.isdigit():
+        return None
+    return dt, table, int(rid)
+
+def _after(col, id_col, table, cursor):
+    # changes of `table` strictly after the cursor key
+    dt, ctable, cid = cursor
+    if table > ctable:
+        return col >= dt
+    if table < ctable:
+        return col > dt
+    return or_(col > dt, and_(col == dt, id_col > cid))
+
+def _changes(db, tables, since, limit) -> dict:
+    keyed = []
+    for table in tables:
+        model, rows, item = _CHANGES[table]
+        q = rows(db).filter(model.updated_at.isnot(None))
+        if since:
+            q = q.filter(_after(model.updated_at, model.id, table, since))
+        for r in q.order_by(model.updated_at, model.id).limit(limit + 1):
+            keyed.append(((r.updated_at, table, r.id), item(r)))
+        if since:  # a first sync starts from the live rows, there is nothing to delete yet
+            q = (db.query(Tombstone.deleted_at, Tombstone.row_id).filter(Tombstone.table_name == table)
+                 .filter(_after(Tombstone.deleted_at, Tombstone.row_id, table, since))
+                 .order_by(Tombstone.deleted_at, Tombstone.row_id).limit(limit + 1))
+            keyed.extend(((dt, table, rid), None) for dt, rid in q)
+    keyed.sort(key=lambda k: k[0])
+    more = len(keyed) > limit
+    keyed = keyed[:limit]
+    # ids are reused after a delete, so one id can have a tombstone and a live
+    # row in the same page; only its latest event counts
+    latest = {(table, rid): item for (_, table, rid), item in keyed}
+    out = {t: {"items": [], "deleted": []} for t in tables}
+    for (table, rid), item in latest.items():
+        if item is None:
+            out[table]["deleted"].append(rid)
+        else:
+            out[table]["items"].append(item)
+    nxt = None
+    if keyed:
+        dt, table, rid = keyed[-1][0]
+        nxt = f"{dt.isoformat()}~{table}~{rid}"
+    return {**out, "next": nxt, "more": more}
+
+def _changes_args(since, limit):
+    cursor = _parse_since(since) if since else None
+    if since and cursor is None:
+        raise HTTPException(400, "invalid since")
+    return cursor, max(1, min(limit or CHANGES_PAGE_MAX, CHANGES_PAGE_MAX))
+
+@app.get("/api/changes.json")
+async def api_changes(request: Request, since: str | None = None, limit: int | None = None,
+                      db=Depends(get_async_read_db)):
+    cursor, limit = _changes_args(since, limit)
+
+    def build(s):
+        res = _changes(s, tuple(_CHANGES), cursor, limit)
+        return {**res, "next": res["next"] or since}  # nothing new: poll again from the same place
+    return await _cached_json(request, (since, limit), tuple(_CHANGES), db, build)
+
+@app.get("/api/changes/{table}.json")
+async def api_table_changes(request: Request, table: str, since: str | None = None, limit: int | None = None,
+                            db=Depends(get_async_read_db)):
+    if table not in _CHANGES:
+        raise HTTPException(404)
+    cursor, limit = _changes_args(since, limit)
+    deps = ("release_notes", "software") if table == "release_notes" else (table,)
+
+    def build(s):
+        res = _changes(s, (table,), cursor, limit)
+        return {**res.pop(table), **res, "next": res["next"] or since}
+    return await _cached_json(request, (since, limit), deps, db, build)
+
+@app.get("/api/clients.json")
+async def api_clients(request: Request, fields: str | None = None, industry: str | None = None,
+                      city: str | None = None, db=Depends(get_async_read_db)):
+    if fields:
+        cols = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        unknown = [f for f in cols if f not in CLIENT_FIELDS]
+        if unknown or not cols:
+            raise HTTPException(400, f"fields must be among {', '.join(CLIENT_FIELDS)}")
+    else:
+        cols = CLIENT_FIELDS
+    return await _cached_json(request, (cols, industry or None, city or None), ("clients",), db,
+                              lambda s: _clients_feed(s, cols, industry or None, city or None))
+
+# --- Search ---
+# One bm25-ranked list across the three FTS5 indexes (see migration 4). Every
+# word of q must match, as a prefix; hits are limited to rows the public feeds
+# would show. highlight/snippet mark matches with control characters so the
+# text can be HTML-escaped before they become <mark> tags.
+SEARCH_PAGE_MAX = 50
+_SEARCH_SQL = """
+SELECT 'software' AS type, s.id AS id, s.slug AS extra,
+       highlight(software_fts, 0, char(2), char(3)) AS title,
+       snippet(software_fts, -1, char(2), char(3), '…', 16) AS snippet,
+       bm25(software_fts, 10.0, 2.0, 4.0) AS rank
+FROM software_fts JOIN software s ON s.id = software_fts.rowid
+WHERE software_fts MATCH :q AND s.is_active = 1
+UNION ALL
+SELECT 'release', r.id, r.version,
+       highlight(release_notes_fts, 0, char(2), char(3)),
+       snippet(release_notes_fts, -1, char(2), char(3), '…', 16),
+       bm25(release_notes_fts, 10.0, 5.0, 1.0)
+FROM release_notes_fts JOIN release_notes r ON r.id = release_notes_fts.rowid
+WHERE release_notes_fts MATCH :q AND r.is_published = 1
+UNION ALL
+SELECT 'issue', k.id, k.status,
+       highlight(known_issues_fts, 0, char(2), char(3)),
+       snippet(known_issues_fts, -1, char(2), char(3), '…', 16),
+       bm25(known_issues_fts, 10.0, 1.0)
+FROM known_issues_fts JOIN known_issues k ON k.id = known_issues_fts.rowid
+WHERE known_issues_fts MATCH :q AND k.is_active = 1
+ORDER BY rank LIMIT :limit OFFSET :offset
+"""
+_SEARCH_URLS = {"software": "/products.html", "release": "/releases.html", "issue": "/known-issues.html"}
+
+def _fts_query(q: str) -> str:
+    words = re.findall(r"\w+", q or "")[:8]
+    return " ".join(f'"{w}"*' for w in words)
+
+def _marked(val) -> str:
+    return html.escape(val or "").replace("\x02", "<mark>").replace("\x03", "</mark>")
+
+def _search_feed(db, q, limit, offset):
+    match = _fts_query(q)
+    if not match:
+        return {"items": [], "next_offset": None}
+    rows = db.execute(text(_SEARCH_SQL), {"q": match, "limit": limit + 1, "offset": offset}).all()
     return {"items": [{
-        "id": x.id, "title": x.title, "status": x.status or "Open", "content": x.content or ""
-    } for x in items if x.is_active]}
+        "type": x.type, "id": x.id, "title": _marked(x.title), "snippet": _marked(x.snippet),
+        "extra": x.extra, "url": _SEARCH_URLS[x.type],
+    } for x in rows[:limit]], "next_offset": offset + limit if len(rows) > limit else None}
+
+@app.get("/api/search.json")
+async def api_search(request: Request, q: str = "", limit: int = 20, offset: int = 0,
+                     db=Depends(get_async_read_db)):
+    limit = max(1, min(limit, SEARCH_PAGE_MAX))
+    offset = max(0, offset)
+    return await _cached_json(request, (q, limit, offset), ("software", "release_notes", "known_issues"), db,
+                              lambda s: _search_feed(s, q, limit, offset))
+
+# --- Static export ---
+# The public feeds and the release notes page are pure functions of the data, so
+# they can be written to disk (with .gz/.br siblings) and served by the CDN.
+# Run `python -m api.app export` before deploying; with EXPORT_ON_WRITE=1 the
+# admin handlers re-export after every commit (off on Vercel: read-only FS).
+EXPORT_DIR = Path(os.environ.get("EXPORT_DIR", str(SITE_DIR)))
+EXPORT_ON_WRITE = os.environ.get("EXPORT_ON_WRITE", "0" if os.environ.get("VERCEL") else "1") == "1"
+RELEASES_PAGE_SIZE = 30
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+_brotli_warned = False
+
+def _have_brotli() -> bool:
+    global _brotli_warned
+    if brotli is None and not _brotli_warned:
+        _brotli_warned = True
+        print("brotli is not installed; static files and feeds are served and exported without .br", file=sys.stderr)
+    return brotli is not None
+
+def _write_static(path: Path, body: bytes) -> bool:
+    if path.exists() and path.read_bytes() == body:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    variants = [(path, body), (path.with_name(path.name + ".gz"), gzip.compress(body, 9, mtime=0))]
+    if _have_brotli():
+        variants.append((path.with_name(path.name + ".br"), brotli.compress(body, quality=11)))
+    for dest, data in variants:
+        tmp = dest.with_name(dest.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, dest)
+    return True
+
+def _release_page_context(db):
+    feed = _releases_feed(db, limit=RELEASES_PAGE_SIZE)
+    for x in feed["items"]:
+        x["release_date"] = _parse_dt(x["release_date"])
+    return {"items": feed["items"], "next": feed["next"]}
+
+def _export_static(out_dir: Path = None) -> list:
+    out_dir = Path(out_dir or EXPORT_DIR)
+    db = _read_session()
+    try:
+        files = {
+            out_dir / "feeds" / "software.json": _feed_bytes(_software_feed(db)),
+            out_dir / "feeds" / "releases.json": _feed_bytes(_releases_feed(db)),
+            out_dir / "feeds" / "known_issues.json": _feed_bytes(_known_issues_feed(db)),
+            out_dir / "feeds" / "clients.json": _feed_bytes(_clients_feed(db)),
+        }
+        ctx = _release_page_context(db)
+    finally:
+        db.close()
+    tpl = templates.get_template("release_notes.html")
+    # the CDN serves assets under their plain names, so bust caches with ?v= instead
+    page = tpl.render(request=None, asset_url=lambda p: asset_url(p, fingerprint=False), **ctx)
+    files[out_dir / "releases.html"] = page.encode("utf-8")
+    return [str(p) for p, body in files.items() if _write_static(p, body)]
+
+def _export_after_write():
+    # debounced: a burst of admin writes shares one queued export
+    if EXPORT_ON_WRITE:
+        _enqueue("export", key="export", delay=JOB_DEBOUNCE_S)
+
+# --- Background jobs ---
+# Post-commit side effects (static export, image variants) run from a jobs
+# table in the app database, so they survive restarts. _enqueue() is cheap and
+# idempotent per key: while a job with that key is still queued, enqueueing it
+# again is a no-op, which with a short delay coalesces bursts of writes. A pool
+# of JOB_WORKERS threads claims due jobs; failures retry with exponential
+# backoff up to max_attempts. Jobs have their own small engine so bookkeeping
+# never waits on the single admin writer connection.
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "2"))
+JOB_MAX_ATTEMPTS = int(os.environ.get("JOB_MAX_ATTEMPTS", "5"))
+JOB_BACKOFF_S = float(os.environ.get("JOB_BACKOFF_S", "2"))
+JOB_DEBOUNCE_S = float(os.environ.get("JOB_DEBOUNCE_S", "1"))
+JOB_LEASE_S = float(os.environ.get("JOB_LEASE_S", "600"))  # a running job older than this is presumed dead
+JOB_KEEP_DAYS = float(os.environ.get("JOB_KEEP_DAYS", "7"))
+_JOBS = {"export": _export_static, "variants": _store_variants}
+
+jobs_engine = create_engine(f"sqlite:///{DB_PATH}", connect_args={"check_same_thread": False},
+                            pool_size=max(JOB_WORKERS, 1), max_overflow=2)
+event.listen(jobs_engine, "connect", _sqlite_pragmas(readonly=False))
+_jobs = Job.__table__
+_jobs_wake = threading.Event()
+_job_threads = []
+_job_threads_lock = threading.Lock()
+_jobs_pruned = 0.0
+
+def _enqueue(kind: str, payload: dict = None, key: str = None, delay: float = 0,
+             max_attempts: int = JOB_MAX_ATTEMPTS):
+    _ensure_schema()
+    now = datetime.datetime.utcnow()
+    stmt = sqlite_insert(_jobs).values(
+        kind=kind, key=key, payload=json.dumps(payload or {}), status="queued", attempts=0,
+        max_attempts=max_attempts, run_at=now + datetime.timedelta(seconds=delay),
+        created_at=now, updated_at=now)
+    if key is not None:
+        stmt = stmt.on_conflict_do_nothing(index_elements=["key"], index_where=text("status = 'queued'"))
+    with jobs_engine.begin() as conn:
+        conn.execute(stmt)
+    _start_job_workers()
+    _jobs_wake.set()
+
+def _claim_job(now=None):
+    now = now or datetime.datetime.utcnow()
+    with jobs_engine.begin() as conn:
+        # requeue work whose worker died; a key that is queued again meanwhile is coalesced
+        stale = and_(_jobs.c.status == "running",
+                     _jobs.c.updated_at < now - datetime.timedelta(seconds=JOB_LEASE_S))
+        conn.execute(update(_jobs).where(stale).values(status="queued").prefix_with("OR IGNORE"))
+        conn.execute(_jobs.delete().where(stale))
+        running = select(_jobs.c.key).where(_jobs.c.status == "running", _jobs.c.key.isnot(None))
+        due = (select(_jobs.c.id)
+               .where(_jobs.c.status == "queued", _jobs.c.run_at <= now,
+                      or_(_jobs.c.key.is_(None), _jobs.c.key.not_in(running)))
+               .order_by(_jobs.c.run_at, _jobs.c.id).limit(1).scalar_subquery())
+        row = conn.execute(
+            update(_jobs).where(_jobs.c.id == due)
+            .values(status="running", attempts=_jobs.c.attempts + 1, updated_at=now)
+            .returning(_jobs.c.id, _jobs.c.kind, _jobs.c.payload, _jobs.c.attempts, _jobs.c.max_attempts)
+        ).first()
+    return row
+
+def _run_job(job):
+    global _jobs_pruned
+    now = datetime.datetime.utcnow()
+    try:
+        fn = _JOBS[job.kind]
+        fn(**json.loads(job.payload or "{}"))
+    except Exception as e:
+        retry = job.attempts < job.max_attempts
+        delay = min(JOB_BACKOFF_S * 2 ** (job.attempts - 1), 300)
+        print(f"job {job.id} ({job.kind}) failed, attempt {job.attempts}/{job.max_attempts}: {e!r}", file=sys.stderr)
+        values = {"status": "queued" if retry else "failed", "last_error": repr(e)[:2000], "updated_at": now}
+        if retry:
+            values["run_at"] = now + datetime.timedelta(seconds=delay)
+        with jobs_engine.begin() as conn:
+            # if the key was queued again meanwhile, that job covers this one
+            res = conn.execute(update(_jobs).where(_jobs.c.id == job.id).values(**values).prefix_with("OR IGNORE"))
+            if not res.rowcount:
+                conn.execute(_jobs.delete().where(_jobs.c.id == job.id))
+        return
+    with jobs_engine.begin() as conn:
+        conn.execute(update(_jobs).where(_jobs.c.id == job.id).values(status="done", last_error=None, updated_at=now))
+        if time.monotonic() - _jobs_pruned > 60:
+            _jobs_pruned = time.monotonic()
+            conn.execute(_jobs.delete().where(_jobs.c.status == "done",
+                                              _jobs.c.updated_at < now - datetime.timedelta(days=JOB_KEEP_DAYS)))
+
+def _next_job_in() -> float:
+    with jobs_engine.connect() as conn:
+        nxt = conn.execute(select(func.min(_jobs.c.run_at)).where(_jobs.c.status == "queued")).scalar()
+    if nxt is None:
+        return 30.0
+    return min(max((nxt - datetime.datetime.utcnow()).total_seconds(), 0.05), 30.0)
+
+def _job_worker():
+    while True:
+        try:
+            job = _claim_job()
+            if job is not None:
+                _run_job(job)
+                continue
+            _jobs_wake.wait(_next_job_in())
+            _jobs_wake.clear()
+        except Exception as e:
+            print(f"job worker error: {e!r}", file=sys.stderr)
+            time.sleep(1)
+
+def _start_job_workers():
+    if len(_job_threads) >= JOB_WORKERS:
+        return
+    with _job_threads_lock:
+        while len(_job_threads) < JOB_WORKERS:
+            t = threading.Thread(target=_job_worker, name=f"jobs-{len(_job_threads)}", daemon=True)
+            t.start()
+            _job_threads.append(t)
+
+def _drain_jobs():
+    # runs everything queued, including debounced jobs, in the calling thread (CLI)
+    far = datetime.datetime.utcnow() + datetime.timedelta(days=1)
+    while (job := _claim_job(far)) is not None:
+        _run_job(job)
+
+# --- Admin: Jobs ---
+@app.get("/admin/jobs")
+def jobs_list(request: Request, status: str = "", db=Depends(get_read_db)):
+    if not is_logged_in(request): return RedirectResponse(url="/admin/login", status_code=303)
+    counts = dict(db.query(Job.status, func.count(Job.id)).group_by(Job.status).all())
+    query = db.query(Job)
+    if status:
+        query = query.filter(Job.status == status)
+    items = query.order_by(Job.id.desc()).limit(200).all()
+    return templates.TemplateResponse("jobs_list.html", {"request": request, "items": items, "counts": counts,
+                                                         "status": status, "workers": JOB_WORKERS})
+
+@app.post("/admin/jobs/{job_id}/retry")
+def jobs_retry(request: Request, job_id: int):
+    if not is_logged_in(request): return RedirectResponse(url="/admin/login", status_code=303)
+    now = datetime.datetime.utcnow()
+    with jobs_engine.begin() as conn:
+        conn.execute(update(_jobs).where(_jobs.c.id == job_id, _jobs.c.status == "failed")
+                     .values(status="queued", attempts=0, run_at=now, updated_at=now).prefix_with("OR IGNORE"))
+    _start_job_workers()
+    _jobs_wake.set()
+    return RedirectResponse(url="/admin/jobs", status_code=303)
 
 # --- Admin Auth ---
 @app.get("/admin")
@@ -238,14 +1423,125 @@ def admin_logout(request: Request):
     request.session.clear()
     return RedirectResponse(url="/admin/login", status_code=303)
 
+# --- Admin list paging ---
+# Admin lists are filtered, sorted and paged in SQL. Pages are keyset based:
+# the cursor is the (sort value, id) of the last row shown, so a deep page
+# costs the same as the first. Each sort is (column, attribute on the row,
+# descending by default, id descending by default).
+ADMIN_PAGE_SIZE = int(os.environ.get("ADMIN_PAGE_SIZE", "50"))
+
+def _rel_url(url) -> str:
+    return f"{url.path}?{url.query}" if url.query else url.path
+
+def _cursor_value(col, raw: str):
+    if isinstance(col.type, Integer):
+        return int(raw)
+    if isinstance(col.type, DateTime):
+        dt = _parse_dt(raw)
+        if dt is None:
+            raise ValueError(raw)
+        return dt
+    return raw
+
+def _keyset_after(col, id_col, value, rid: int, desc: bool, id_desc: bool):
+    # rows strictly after (value, rid); SQLite puts NULLs first ascending, last descending
+    id_after = id_col < rid if id_desc else id_col > rid
+    if value is None:
+        tie = and_(col.is_(None), id_after)
+        return tie if desc else or_(tie, col.isnot(None))
+    beyond = col < value if desc else col > value
+    tie = and_(col == value, id_after)
+    return or_(beyond, tie, col.is_(None)) if desc else or_(beyond, tie)
+
+def _admin_page(request: Request, query, id_col, sorts: dict, default: str, prepare=None) -> dict:
+    qp = request.query_params
+    sort = qp.get("sort") if qp.get("sort") in sorts else default
+    col, attr, desc, id_desc = sorts[sort]
+    if qp.get("dir") in ("asc", "desc") and (qp["dir"] == "desc") != desc:
+        desc, id_desc = not desc, not id_desc
+    limit = max(1, min(_to_int(qp.get("limit")) or ADMIN_PAGE_SIZE, 500))
+
+    cursor, back = qp.get("after"), False
+    if not cursor and qp.get("before"):
+        cursor, back = qp["before"], True
+    # paging backwards walks the reversed order and flips the page afterwards
+    cdesc, cid_desc = (not desc, not id_desc) if back else (desc, id_desc)
+    if cursor:
+        raw, sep, rid = cursor.rpartition("~")
+        try:
+            if not sep or raw[:1] not in ("-", "="):
+                raise ValueError(cursor)
+            value = None if raw[0] == "-" else _cursor_value(col, raw[1:])
+            query = query.filter(_keyset_after(col, id_col, value, int(rid), cdesc, cid_desc))
+        except ValueError:
+            raise HTTPException(400, "invalid cursor")
+    rows = query.order_by(col.desc() if cdesc else col.asc(),
+                          id_col.desc() if cid_desc else id_col.asc()).limit(limit + 1).all()
+    more = len(rows) > limit
+    rows = rows[:limit]
+    if back:
+        rows.reverse()
+    if prepare:
+        rows = [prepare(r) for r in rows]
+
+    def key(x):
+        v = getattr(x, attr)
+        if v is None:
+            return f"-~{x.id}"
+        return f"={v.isoformat() if isinstance(v, datetime.datetime) else v}~{x.id}"
+    base = request.url.remove_query_params(["after", "before"])
+    has_next = True if back else more
+    has_prev = more if back else bool(cursor)
+    sort_urls = {}
+    for name, (_, _, d, _) in sorts.items():
+        ndir = ("asc" if desc else "desc") if name == sort else ("desc" if d else "asc")
+        sort_urls[name] = _rel_url(base.include_query_params(sort=name, dir=ndir))
+    return {
+        "items": rows,
+        "next_url": _rel_url(base.include_query_params(after=key(rows[-1]))) if rows and has_next else None,
+        "prev_url": _rel_url(base.include_query_params(before=key(rows[0]))) if rows and has_prev else None,
+        "sort": sort, "dir": "desc" if desc else "asc", "sort_urls": sort_urls,
+        "filters": dict(qp),
+    }
+
+def _like(q: str) -> str:
+    return "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+def _flag(val, yes: str, no: str):
+    return True if val == yes else False if val == no else None
+
 # --- Admin: Releases ---
+_RELEASE_SORTS = {
+    "date": (ReleaseNote.release_date, "release_date", True, True),
+    "title": (ReleaseNote.title, "title", False, False),
+    "version": (ReleaseNote.version, "version", False, False),
+    "software": (Software.name, "software_name", False, False),
+    "id": (ReleaseNote.id, "id", True, True),
+}
+
+def _with_software_name(row):
+    note, name = row
+    note.software_name = name
+    return note
+
 @app.get("/admin/releases")
-def releases_list(request: Request, db=Depends(get_db)):
+def releases_list(request: Request, q: str = "", software_id: str = "", published: str = "",
+                  db=Depends(get_read_db)):
     if not is_logged_in(request): return RedirectResponse(url="/admin/login", status_code=303)
-    items = db.query(ReleaseNote).order_by(ReleaseNote.release_date.desc(), ReleaseNote.id.desc()).all()
-    sitems = db.query(Software).order_by(Software.name).all()
-    smap = {s.id: s.name for s in sitems}
-    return templates.TemplateResponse("releases_list.html", {"request": request, "items": items, "smap": smap})
+    query = (db.query(ReleaseNote, Software.name)
+             .outerjoin(Software, Software.id == ReleaseNote.software_id))
+    if q.strip():
+        pat = _like(q.strip())
+        query = query.filter(or_(ReleaseNote.title.like(pat, escape="\\"), ReleaseNote.version.like(pat, escape="\\")))
+    sid = _to_int(software_id)
+    if sid is not None:
+        query = query.filter(ReleaseNote.software_id == sid)
+    flag = _flag(published, "yes", "no")
+    if flag is not None:
+        query = query.filter(ReleaseNote.is_published == flag)
+    page = _admin_page(request, query, ReleaseNote.id, _RELEASE_SORTS, "date", _with_software_name)
+    software_items = db.query(Software.id, Software.name).order_by(Software.name).all()
+    return templates.TemplateResponse("releases_list.html", {"request": request, "software_items": software_items, **page})
 
 @app.get("/admin/releases/new")
 def releases_new(request: Request, db=Depends(get_db)):
@@ -267,6 +1563,7 @@ def releases_new_post(request: Request,
     item = ReleaseNote(title=title, version=(version or None), software_id=sid, release_date=dt,
                        content=(content or None), is_published=is_published)
     db.add(item); db.commit()
+    _touch("release_notes")
     return RedirectResponse(url="/admin/releases", status_code=303)
 
 @app.get("/admin/releases/{rid}/edit")
@@ -298,21 +1595,45 @@ def releases_edit_post(request: Request, rid: int,
     item.is_published = is_published
     item.updated_at = datetime.datetime.utcnow()
     db.commit()
+    _touch("release_notes")
     return RedirectResponse(url="/admin/releases", status_code=303)
 
 @app.post("/admin/releases/{rid}/delete")
 def releases_delete(request: Request, rid: int, db=Depends(get_db)):
     if not is_logged_in(request): return RedirectResponse(url="/admin/login", status_code=303)
     item = db.query(ReleaseNote).get(rid)
-    if item: db.delete(item); db.commit()
+    if item: db.delete(item); _tombstone(db, "release_notes", rid); db.commit(); _touch("release_notes")
     return RedirectResponse(url="/admin/releases", status_code=303)
 
 # --- Admin: Software ---
+_SOFTWARE_SORTS = {
+    "order": (Software.sort_order, "sort_order", False, False),
+    "name": (Software.name, "name", False, False),
+    "category": (Software.category, "category", False, False),
+    "updated": (Software.updated_at, "updated_at", True, True),
+    "id": (Software.id, "id", True, True),
+}
+
 @app.get("/admin/software")
-def software_list(request: Request, db=Depends(get_db)):
+def software_list(request: Request, q: str = "", category: str = "", status: str = "", free: str = "",
+                  db=Depends(get_read_db)):
     if not is_logged_in(request): return RedirectResponse(url="/admin/login", status_code=303)
-    items = db.query(Software).order_by(Software.sort_order, Software.id).all()
-    return templates.TemplateResponse("software_list.html", {"request": request, "items": items})
+    query = db.query(Software)
+    if q.strip():
+        pat = _like(q.strip())
+        query = query.filter(or_(Software.name.like(pat, escape="\\"), Software.slug.like(pat, escape="\\")))
+    if category:
+        query = query.filter(Software.category == category)
+    flag = _flag(status, "active", "hidden")
+    if flag is not None:
+        query = query.filter(Software.is_active == flag)
+    flag = _flag(free, "free", "paid")
+    if flag is not None:
+        query = query.filter(Software.is_free == flag)
+    page = _admin_page(request, query, Software.id, _SOFTWARE_SORTS, "order")
+    categories = [c for (c,) in db.query(Software.category).filter(Software.category.isnot(None))
+                  .distinct().order_by(Software.category)]
+    return templates.TemplateResponse("software_list.html", {"request": request, "categories": categories, **page})
 
 @app.get("/admin/software/new")
 def software_new(request: Request):
@@ -320,7 +1641,7 @@ def software_new(request: Request):
     return templates.TemplateResponse("software_form.html", {"request": request, "item": None})
 
 @app.post("/admin/software/new")
-def software_new_post(request: Request,
+async def software_new_post(request: Request,
     name: str = Form(...), slug: str = Form(""), category: str = Form(""),
     description: str = Form(""), price_one_time: str = Form(""),
     price_yearly: str = Form(""), is_free: bool = Form(False),
@@ -329,18 +1650,22 @@ def software_new_post(request: Request,
     sort_order: int = Form(0), image_file: UploadFile = File(None),
     db=Depends(get_db)):
     if not is_logged_in(request): return RedirectResponse(url="/admin/login", status_code=303)
-    image_url = _save_upload(image_file)
-    p1 = None if is_free else _to_int(price_one_time)
-    p2 = None if is_free else _to_int(price_yearly)
-    item = Software(
-        name=name, slug=slug or None, category=category or None,
-        description=description or None, price_one_time=p1, price_yearly=p2,
-        is_free=is_free, is_active=is_active, download_url=(download_url or None),
-        payment_link_onetime=(payment_link_onetime or None),
-        payment_link_yearly=(payment_link_yearly or None), image=image_url,
-        sort_order=sort_order or 0
-    )
-    db.add(item); db.commit()
+    image_url = await _save_upload(image_file)
+    def save():
+        p1 = None if is_free else _to_int(price_one_time)
+        p2 = None if is_free else _to_int(price_yearly)
+        item = Software(
+            name=name, slug=slug or None, category=category or None,
+            description=description or None, price_one_time=p1, price_yearly=p2,
+            is_free=is_free, is_active=is_active, download_url=(download_url or None),
+            payment_link_onetime=(payment_link_onetime or None),
+            payment_link_yearly=(payment_link_yearly or None), image=image_url,
+            sort_order=sort_order or 0
+        )
+        db.add(item); db.commit()
+        _touch("software")
+        _queue_variants("software", item.id, item.image)
+    await run_in_threadpool(save)
     return RedirectResponse(url="/admin/software", status_code=303)
 
 @app.get("/admin/software/{item_id}/edit")
@@ -351,7 +1676,7 @@ def software_edit(request: Request, item_id: int, db=Depends(get_db)):
     return templates.TemplateResponse("software_form.html", {"request": request, "item": item})
 
 @app.post("/admin/software/{item_id}/edit")
-def software_edit_post(request: Request, item_id: int,
+async def software_edit_post(request: Request, item_id: int,
     name: str = Form(...), slug: str = Form(""), category: str = Form(""),
     description: str = Form(""), price_one_time: str = Form(""),
     price_yearly: str = Form(""), is_free: bool = Form(False),
@@ -360,28 +1685,36 @@ def software_edit_post(request: Request, item_id: int,
     sort_order: int = Form(0), remove_image: bool = Form(False),
     image_file: UploadFile = File(None), db=Depends(get_db)):
     if not is_logged_in(request): return RedirectResponse(url="/admin/login", status_code=303)
-    item = db.query(Software).get(item_id)
-    if not item: raise HTTPException(404)
-    item.name = name
-    item.slug = slug or None
-    item.category = category or None
-    item.description = description or None
-    item.price_one_time = None if is_free else _to_int(price_one_time)
-    item.price_yearly = None if is_free else _to_int(price_yearly)
-    item.is_free = is_free
-    item.is_active = is_active
-    item.download_url = download_url or None
-    item.payment_link_onetime = payment_link_onetime or None
-    item.payment_link_yearly = payment_link_yearly or None
-    item.sort_order = sort_order or 0
-    if remove_image:
-        item.image = None
-    else:
-        new_url = _save_upload(image_file)
-        if new_url:
+    # checked before the upload is stored, so a bad id leaves no orphan file behind
+    if not await run_in_threadpool(_exists, db, Software, item_id): raise HTTPException(404)
+    new_url = None if remove_image else await _save_upload(image_file)
+    def save():
+        item = db.query(Software).get(item_id)
+        if not item: raise HTTPException(404)
+        item.name = name
+        item.slug = slug or None
+        item.category = category or None
+        item.description = description or None
+        item.price_one_time = None if is_free else _to_int(price_one_time)
+        item.price_yearly = None if is_free else _to_int(price_yearly)
+        item.is_free = is_free
+        item.is_active = is_active
+        item.download_url = download_url or None
+        item.payment_link_onetime = payment_link_onetime or None
+        item.payment_link_yearly = payment_link_yearly or None
+        item.sort_order = sort_order or 0
+        if remove_image:
+            item.image = None
+            item.image_variants = None
+        elif new_url and new_url != item.image:
             item.image = new_url
-    item.updated_at = datetime.datetime.utcnow()
-    db.commit()
+            item.image_variants = None
+        item.updated_at = datetime.datetime.utcnow()
+        db.commit()
+        _touch("software")
+        if new_url and not item.image_variants:
+            _queue_variants("software", item.id, item.image)
+    await run_in_threadpool(save)
     return RedirectResponse(url="/admin/software", status_code=303)
 
 @app.post("/admin/software/{item_id}/delete")
@@ -389,15 +1722,43 @@ def software_delete(request: Request, item_id: int, db=Depends(get_db)):
     if not is_logged_in(request): return RedirectResponse(url="/admin/login", status_code=303)
     item = db.query(Software).get(item_id)
     if item:
-        db.delete(item); db.commit()
+        db.delete(item); _tombstone(db, "software", item_id)
+        # their software_name is gone with it
+        (db.query(ReleaseNote).filter(ReleaseNote.software_id == item_id)
+         .update({ReleaseNote.updated_at: datetime.datetime.utcnow()}, synchronize_session=False))
+        db.commit()
+        _touch("software")
     return RedirectResponse(url="/admin/software", status_code=303)
 
 # --- Admin: Clients ---
+_CLIENT_SORTS = {
+    "order": (Client.sort_order, "sort_order", False, True),
+    "name": (Client.name, "name", False, False),
+    "industry": (Client.industry, "industry", False, False),
+    "city": (Client.city, "city", False, False),
+    "id": (Client.id, "id", True, True),
+}
+
 @app.get("/admin/clients")
-def clients_list(request: Request, db=Depends(get_db)):
+def clients_list(request: Request, q: str = "", industry: str = "", city: str = "", status: str = "",
+                 db=Depends(get_read_db)):
     if not is_logged_in(request): return RedirectResponse(url="/admin/login", status_code=303)
-    items = db.query(Client).order_by(Client.sort_order.asc(), Client.id.desc()).all()
-    return templates.TemplateResponse("clients_list.html", {"request": request, "items": items})
+    query = db.query(Client)
+    if q.strip():
+        query = query.filter(Client.name.like(_like(q.strip()), escape="\\"))
+    if industry:
+        query = query.filter(Client.industry == industry)
+    if city:
+        query = query.filter(Client.city == city)
+    flag = _flag(status, "active", "hidden")
+    if flag is not None:
+        query = query.filter(Client.is_active == flag)
+    page = _admin_page(request, query, Client.id, _CLIENT_SORTS, "order")
+    industries = [v for (v,) in db.query(Client.industry).filter(Client.industry.isnot(None))
+                  .distinct().order_by(Client.industry)]
+    cities = [v for (v,) in db.query(Client.city).filter(Client.city.isnot(None)).distinct().order_by(Client.city)]
+    return templates.TemplateResponse("clients_list.html", {"request": request, "industries": industries,
+                                                            "cities": cities, **page})
 
 @app.get("/admin/clients/new")
 def clients_new(request: Request):
@@ -405,16 +1766,20 @@ def clients_new(request: Request):
     return templates.TemplateResponse("clients_form.html", {"request": request, "item": None})
 
 @app.post("/admin/clients/new")
-def clients_new_post(request: Request,
+async def clients_new_post(request: Request,
     name: str = Form(...), industry: str = Form(None), city: str = Form(None),
     website: str = Form(None), sort_order: int = Form(0),
     is_active: bool = Form(False), image: UploadFile = File(None), db=Depends(get_db)):
     if not is_logged_in(request): return RedirectResponse(url="/admin/login", status_code=303)
-    image_url = _save_upload(image)
-    item = Client(name=name.strip(), industry=(industry or None), city=(city or None),
-                  website=(website or None), sort_order=sort_order or 0,
-                  is_active=bool(is_active), image=image_url)
-    db.add(item); db.commit()
+    image_url = await _save_upload(image)
+    def save():
+        item = Client(name=name.strip(), industry=(industry or None), city=(city or None),
+                      website=(website or None), sort_order=sort_order or 0,
+                      is_active=bool(is_active), image=image_url)
+        db.add(item); db.commit()
+        _touch("clients")
+        _queue_variants("clients", item.id, item.image)
+    await run_in_threadpool(save)
     return RedirectResponse(url="/admin/clients", status_code=303)
 
 @app.get("/admin/clients/{item_id}/edit")
@@ -425,23 +1790,31 @@ def clients_edit(request: Request, item_id: int, db=Depends(get_db)):
     return templates.TemplateResponse("clients_form.html", {"request": request, "item": item})
 
 @app.post("/admin/clients/{item_id}/edit")
-def clients_edit_post(request: Request, item_id: int,
+async def clients_edit_post(request: Request, item_id: int,
     name: str = Form(...), industry: str = Form(None), city: str = Form(None),
     website: str = Form(None), sort_order: int = Form(0),
     is_active: bool = Form(False), image: UploadFile = File(None), db=Depends(get_db)):
     if not is_logged_in(request): return RedirectResponse(url="/admin/login", status_code=303)
-    item = db.query(Client).get(item_id)
-    if not item: raise HTTPException(404)
-    image_url = _save_upload(image) or item.image
-    item.name = name.strip()
-    item.industry = (industry or None)
-    item.city = (city or None)
-    item.website = (website or None)
-    item.sort_order = sort_order or 0
-    item.is_active = bool(is_active)
-    item.image = image_url
-    item.updated_at = datetime.datetime.utcnow()
-    db.commit()
+    if not await run_in_threadpool(_exists, db, Client, item_id): raise HTTPException(404)
+    new_url = await _save_upload(image)
+    def save():
+        item = db.query(Client).get(item_id)
+        if not item: raise HTTPException(404)
+        item.name = name.strip()
+        item.industry = (industry or None)
+        item.city = (city or None)
+        item.website = (website or None)
+        item.sort_order = sort_order or 0
+        item.is_active = bool(is_active)
+        if new_url and new_url != item.image:
+            item.image = new_url
+            item.image_variants = None
+        item.updated_at = datetime.datetime.utcnow()
+        db.commit()
+        _touch("clients")
+        if not item.image_variants:
+            _queue_variants("clients", item.id, item.image)
+    await run_in_threadpool(save)
     return RedirectResponse(url="/admin/clients", status_code=303)
 
 @app.post("/admin/clients/{item_id}/delete")
@@ -450,22 +1823,471 @@ def clients_delete(request: Request, item_id: int, db=Depends(get_db)):
     item = db.query(Client).get(item_id)
     if item:
         db.delete(item); db.commit()
+        _touch("clients")
     return RedirectResponse(url="/admin/clients", status_code=303)
 
+# --- Admin: Bulk import/export ---
+# NDJSON or CSV in and out of any of the four tables. Imports upsert on a
+# natural key in batched executemany statements inside one transaction and
+# report bad rows instead of failing the whole file; exports stream rows from
+# a cursor instead of loading the table. Besides the admin session, the bulk
+# endpoints accept HTTP Basic auth with the admin credentials, for scripts.
+BULK_BATCH = 1000
+BULK_ERRORS_MAX = 1000
+_BULK = {
+    "software": {"model": Software, "key": ("slug",), "required": ("name", "slug")},
+    "release_notes": {"model": ReleaseNote, "key": ("software_id", "version"), "required": ("title", "version")},
+    "known_issues": {"model": KnownIssue, "key": ("title",), "required": ("title",)},
+    "clients": {"model": Client, "key": ("name",), "required": ("name",)},
+}
+_BULK_SKIP = {"id", "created_at", "updated_at", "image_variants"}
+
+def _bulk_spec(table: str) -> dict:
+    spec = _BULK.get(table)
+    if not spec:
+        raise HTTPException(404, f"unknown table {table!r}")
+    return spec
+
+def _bulk_authorized(request: Request) -> bool:
+    if is_logged_in(request):
+        return True
+    auth = request.headers.get("authorization", "")
+    if not auth.lower().startswith("basic "):
+        return False
+    try:
+        user, _, pw = base64.b64decode(auth[6:]).decode("utf-8").partition(":")
+    except Exception:
+        return False
+    return secrets.compare_digest(user, ADMIN_USER) and secrets.compare_digest(pw, ADMIN_PASSWORD)
+
+def _coerce(col, val):
+    if val is None or (isinstance(val, str) and val.strip() == ""):
+        return None
+    if isinstance(col.type, Boolean):
+        if isinstance(val, bool):
+            return val
+        s = str(val).strip().lower()
+        if s in ("1", "true", "yes", "on"):
+            return True
+        if s in ("0", "false", "no", "off"):
+            return False
+        raise ValueError(f"{col.name}: expected a boolean")
+    if isinstance(col.type, Integer):
+        if isinstance(val, bool) or (isinstance(val, float) and not val.is_integer()):
+            raise ValueError(f"{col.name}: expected an integer")
+        try:
+            return int(val) if isinstance(val, (int, float)) else int(str(val).strip())
+        except ValueError:
+            raise ValueError(f"{col.name}: expected an integer")
+    if isinstance(col.type, DateTime):
+        dt = _parse_dt(val)
+        if dt is None:
+            raise ValueError(f"{col.name}: expected an ISO date")
+        return dt
+    return str(val)
+
+def _bulk_rows(fileobj, fmt: str):
+    # yields (line_no, dict | None, error | None) from a binary file object
+    stream = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row, None
+        return
+    for n, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield n, None, f"invalid JSON: {e}"
+            continue
+        yield (n, row, None) if isinstance(row, dict) else (n, None, "expected a JSON object")
+
+def _bulk_import(table: str, rows, now=None) -> dict:
+    spec = _bulk_spec(table)
+    t = spec["model"].__table__
+    cols = {c.name: c for c in t.columns if c.name not in _BULK_SKIP}
+    report = {"table": table, "inserted": 0, "updated": 0, "error_count": 0, "errors": []}
+
+    def fail(line, msg):
+        report["error_count"] += 1
+        if len(report["errors"]) < BULK_ERRORS_MAX:
+            report["errors"].append({"line": line, "error": msg})
+
+    with engine.begin() as conn:
+        # stamped while holding the writer, so updated_at follows commit order (see Delta sync)
+        now = now or datetime.datetime.utcnow()
+        slugs = None
+        if table == "release_notes":
+            slugs = {s: i for i, s in conn.execute(select(Software.id, Software.slug)) if s}
+
+        def flush(batch):
+            key = spec["key"]
+            existing = {}
+            if key == ("software_id", "version"):
+                found = conn.execute(select(t.c.id, t.c.software_id, t.c.version)
+                                     .where(t.c.version.in_({k[1] for k in batch})))
+                existing = {(sid, ver): i for i, sid, ver in found}
+            else:
+                found = conn.execute(select(t.c.id, t.c[key[0]]).where(t.c[key[0]].in_({k[0] for k in batch})))
+                existing = {(v,): i for i, v in found}
+            # executemany needs identical keys per statement, so group by column set
+            groups = {}
+            for k, values in batch.items():
+                rid = existing.get(k)
+                values["updated_at"] = now
+                if rid is not None:
+                    values["_id"] = rid
+                groups.setdefault((rid is not None, tuple(sorted(values))), []).append(values)
+            for (is_update, names), params in groups.items():
+                if is_update:
+                    stmt = (update(t).where(t.c.id == bindparam("_id"))
+                            .values({n: bindparam(n) for n in names if n != "_id"}))
+                    conn.execute(stmt, params)
+                    report["updated"] += len(params)
+                else:
+                    conn.execute(insert(t), params)
+                    report["inserted"] += len(params)
+
+        batch = {}
+        for line, row, err in rows:
+            if err:
+                fail(line, err)
+                continue
+            try:
+                values = {}
+                for name, val in row.items():
+                    if name in cols:
+                        values[name] = _coerce(cols[name], val)
+                if slugs is not None and values.get("software_id") is None and row.get("software_slug"):
+                    if row["software_slug"] not in slugs:
+                        raise ValueError(f"software_slug: no software {row['software_slug']!r}")
+                    values["software_id"] = slugs[row["software_slug"]]
+                missing = [c for c in spec["required"] if values.get(c) in (None, "")]
+                if missing:
+                    raise ValueError(f"missing {', '.join(missing)}")
+            except (ValueError, AttributeError) as e:
+                fail(line, str(e))
+                continue
+            batch[tuple(values.get(k) for k in spec["key"])] = values  # last row wins
+            if len(batch) >= BULK_BATCH:
+                flush(batch)
+                batch = {}
+        if batch:
+            flush(batch)
+    _touch(table)
+    return report
+
+def _bulk_export(table: str, fmt: str):
+    # yields encoded chunks; the cursor streams rows in yield_per batches
+    t = _bulk_spec(table)["model"].__table__
+    stmt = select(*t.columns)
+    names = [c.name for c in t.columns]
+    if table == "release_notes":
+        stmt = stmt.add_columns(Software.slug.label("software_slug")).outerjoin(
+            Software.__table__, Software.id == t.c.software_id)
+        names.append("software_slug")
+    stmt = stmt.order_by(t.c.id)
+
+    def fmt_value(v):
+        if isinstance(v, datetime.datetime):
+            return v.isoformat()
+        return v
+
+    db = _read_session()
+    try:
+        result = db.connection().execution_options(stream_results=True, yield_per=BULK_BATCH).execute(stmt)
+        if fmt == "csv":
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerow(names)
+            for part in result.partitions():
+                for row in part:
+                    writer.writerow(["true" if v is True else "false" if v is False else
+                                     "" if v is None else fmt_value(v) for v in row])
+                yield buf.getvalue().encode("utf-8")
+                buf.seek(0); buf.truncate()
+            if buf.tell():
+                yield buf.getvalue().encode("utf-8")
+        else:
+            for part in result.partitions():
+                yield "".join(json.dumps(dict(zip(names, map(fmt_value, row))), ensure_ascii=False) + "\n"
+                              for row in part).encode("utf-8")
+    finally:
+        db.close()
+
+_BULK_MEDIA = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+@app.get("/admin/bulk/{table}/export")
+def bulk_export(request: Request, table: str, format: str = "ndjson"):
+    if not _bulk_authorized(request): raise HTTPException(401, headers={"WWW-Authenticate": "Basic"})
+    _bulk_spec(table)
+    if format not in _BULK_MEDIA: raise HTTPException(400, "format must be ndjson or csv")
+    return StreamingResponse(_bulk_export(table, format), media_type=_BULK_MEDIA[format],
+                             headers={"Content-Disposition": f'attachment; filename="{table}.{format}"'})
+
+@app.post("/admin/bulk/{table}/import")
+async def bulk_import(request: Request, table: str, format: str = "ndjson"):
+    if not _bulk_authorized(request): raise HTTPException(401, headers={"WWW-Authenticate": "Basic"})
+    _bulk_spec(table)
+    if format not in _BULK_MEDIA: raise HTTPException(400, "format must be ndjson or csv")
+    # the raw request body is the file; spool it so memory stays bounded
+    spool = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    try:
+        async for chunk in request.stream():
+            await run_in_threadpool(spool.write, chunk)
+        spool.seek(0)
+        _ensure_schema()
+        report = await run_in_threadpool(lambda: _bulk_import(table, _bulk_rows(spool, format)))
+    finally:
+        spool.close()
+    return JSONResponse(report)
+
 # --- Templates page for /releases ---
 @app.get("/releases.html")
 @app.get("/releases")
-def releases_page(request: Request):
-    return templates.TemplateResponse("release_notes.html", {"request": request})
+def releases_page(request: Request, db=Depends(get_read_db)):
+    return templates.TemplateResponse("release_notes.html", {"request": request, **_release_page_context(db)})
+
+# --- Static site ---
+# Local / self-hosted serving of the repo root. Only site files are exposed
+# (see SITE_HIDDEN). Files under /assets/ also answer at a fingerprinted name,
+# styles.<hash>.css, cached as immutable like the vercel.json /assets/ rule;
+# HTML pages are rewritten to link those names. Other files revalidate with
+# ETag / Last-Modified. Compressible files are served from a fresh .br/.gz
+# sibling when the client accepts it, or from STATIC_CACHE_DIR, which is
+# filled in the background after the first miss. FileResponse does Range
+# requests and hands the file to the server (pathsend) where it supports it.
+STATIC_FINGERPRINT = not os.environ.get("VERCEL") and os.environ.get("STATIC_FINGERPRINT", "1") == "1"
+STATIC_CACHE_DIR = Path(os.environ.get("STATIC_CACHE_DIR", "/tmp/static-cache"))
+STATIC_COMPRESS_MIN = 1024
+SITE_HIDDEN = (".*", "*/.*", "__pycache__", "*/__pycache__", "*/__pycache__/*",
+               "api", "api/*", "templates", "templates/*", "bench", "bench/*", "assets/data", "assets/data/*",
+               "*.db", "*.db-*", "*.py", "*.pyc", "*.jsonl", "*.patch", "*.tmp",
+               "requirements.txt", "runtime.txt", "vercel.json")
+_IMMUTABLE = "public, max-age=31536000, immutable"
+_REVALIDATE = "public, max-age=0, must-revalidate"
+_FINGERPRINTED = re.compile(r"^(assets/.+)\.([0-9a-f]{10})(\.[A-Za-z0-9]+)$")
+_ASSET_REF = re.compile(rb"""((?:src|href)=["'])(/?)(assets/[^"'?#]+)(\?[^"'#]*)?""")
+_asset_hashes = {}   # relative path -> (mtime_ns, size, digest)
+_page_cache = {}     # html path -> (stat key, [(asset, digest)], {encoding: body}, etag)
+_compressing = set()
+
+def _site_hidden(rel: str) -> bool:
+    return any(fnmatch.fnmatchcase(rel, pat) for pat in SITE_HIDDEN)
+
+def _asset_hash(rel: str):
+    try:
+        st = os.stat(SITE_DIR / rel)
+    except OSError:
+        return None
+    hit = _asset_hashes.get(rel)
+    if hit and hit[:2] == (st.st_mtime_ns, st.st_size):
+        return hit[2]
+    h = hashlib.sha256()
+    with open(SITE_DIR / rel, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    _asset_hashes[rel] = (st.st_mtime_ns, st.st_size, h.hexdigest()[:10])
+    return _asset_hashes[rel][2]
+
+def asset_url(path: str, fingerprint: bool = None) -> str:
+    # used by the templates; the path keeps its leading slash (or lack of one)
+    rel = path.lstrip("/")
+    digest = _asset_hash(rel) if rel.startswith("assets/") and not _site_hidden(rel) else None
+    if digest is None:
+        return path
+    if fingerprint if fingerprint is not None else STATIC_FINGERPRINT:
+        stem, ext = os.path.splitext(path)
+        return f"{stem}.{digest}{ext}"
+    return f"{path}?v={digest}"
+
+def _compressible(path: str) -> bool:
+    ctype = mimetypes.guess_type(path)[0] or ""
+    return ctype.startswith("text/") or ctype in ("application/javascript", "application/json",
+                                                  "image/svg+xml", "application/xml", "application/manifest+json")
+
+def _accepts(scope) -> list:
+    accept = dict(scope["headers"]).get(b"accept-encoding", b"").decode("latin-1").lower()
+    encs = []
+    if "br" in accept and _have_brotli():
+        encs.append("br")
+    if "gzip" in accept:
+        encs.append("gzip")
+    return encs
+
+def _compressed_path(full_path: str, st, enc: str):
+    ext = ".br" if enc == "br" else ".gz"
+    key = hashlib.sha1(full_path.encode("utf-8", "surrogateescape")).hexdigest()
+    cached = STATIC_CACHE_DIR / f"{key}-{st.st_mtime_ns}-{st.st_size}{ext}"
+    for alt in (full_path + ext, str(cached)):
+        try:
+            alt_st = os.stat(alt)
+        except OSError:
+            continue
+        if alt_st.st_mtime_ns >= st.st_mtime_ns:
+            return alt, alt_st
+    if (full_path, enc) not in _compressing:
+        _compressing.add((full_path, enc))
+        threading.Thread(target=_compress_static, args=(full_path, enc, cached), daemon=True).start()
+    return None
+
+def _compress_static(full_path: str, enc: str, dest: Path):
+    try:
+        data = Path(full_path).read_bytes()
+        body = brotli.compress(data, quality=11) if enc == "br" else gzip.compress(data, 9, mtime=0)
+        if len(body) < len(data):
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest.with_name(f"{dest.name}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, dest)
+    except Exception as e:
+        print(f"static compression failed for {full_path}: {e}", file=sys.stderr)
+    finally:
+        _compressing.discard((full_path, enc))
+
+def _render_page(full_path: str, st) -> tuple:
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _page_cache.get(full_path)
+    if hit and hit[0] == key and all(_asset_hash(rel) == d for rel, d in hit[1]):
+        return hit
+    raw = Path(full_path).read_bytes()
+    refs = []
+    def sub(m):
+        rel = m.group(3).decode("utf-8", "replace")
+        digest = _asset_hash(rel) if not _site_hidden(rel) else None
+        if digest is None:
+            return m.group(0)
+        refs.append((rel, digest))
+        stem, ext = os.path.splitext(m.group(3))
+        return m.group(1) + m.group(2) + stem + b"." + digest.encode() + ext
+    body = _ASSET_REF.sub(sub, raw) if STATIC_FINGERPRINT else raw
+    bodies = {"": body, "gzip": gzip.compress(body, 6, mtime=0)}
+    if _have_brotli():
+        bodies["br"] = brotli.compress(body, quality=5)
+    entry = (key, refs, bodies, hashlib.sha256(body).hexdigest()[:16])
+    _page_cache[full_path] = entry
+    return entry
+
+class _PageResponse(Response):
+    # an HTML page with its asset links fingerprinted, cached in memory per encoding
+    def __init__(self, full_path, stat_result, status_code=200):
+        super().__init__(status_code=status_code, media_type="text/html")
+        self.full_path, self.stat_result = str(full_path), stat_result
+
+    async def __call__(self, scope, receive, send):
+        _, _, bodies, digest = await run_in_threadpool(_render_page, self.full_path, self.stat_result)
+        enc = next((e for e in _accepts(scope) if e in bodies), "")
+        etag = f'"{digest}-{enc}"' if enc else f'"{digest}"'
+        headers = {"etag": etag, "cache-control": "no-cache", "vary": "Accept-Encoding"}
+        if self.status_code == 200 and _etag_matches(Request(scope), etag):
+            return await Response(status_code=304, headers=headers)(scope, receive, send)
+        if enc:
+            headers["content-encoding"] = enc
+        await Response(bodies[enc], status_code=self.status_code, media_type="text/html",
+                       headers=headers)(scope, receive, send)
+
+class _SiteFiles(StaticFiles):
+    async def get_response(self, path: str, scope) -> Response:
+        rel = path.replace(os.sep, "/")
+        if rel != "." and _site_hidden(rel):
+            raise HTTPException(404)
+        immutable = False
+        m = _FINGERPRINTED.match(rel)
+        if m:
+            digest = await run_in_threadpool(_asset_hash, m.group(1) + m.group(3))
+            if digest is not None:
+                # a stale fingerprint still gets the current file, just not as immutable
+                path, immutable = (m.group(1) + m.group(3)).replace("/", os.sep), digest == m.group(2)
+        response = await super().get_response(path, scope)
+        if not isinstance(response, _PageResponse) and "cache-control" not in response.headers:
+            response.headers["cache-control"] = _IMMUTABLE if immutable else _REVALIDATE
+        return response
+
+    def file_response(self, full_path, stat_result, scope, status_code=200) -> Response:
+        full_path = str(full_path)
+        if full_path.endswith(".html"):
+            return _PageResponse(full_path, stat_result, status_code)
+        if not _compressible(full_path) or stat_result.st_size < STATIC_COMPRESS_MIN:
+            return super().file_response(full_path, stat_result, scope, status_code)
+        media_type = mimetypes.guess_type(full_path)[0]
+        for enc in _accepts(scope):
+            alt = _compressed_path(full_path, stat_result, enc)
+            if alt:
+                response = FileResponse(alt[0], status_code=status_code, stat_result=alt[1], media_type=media_type,
+                                        headers={"content-encoding": enc, "vary": "Accept-Encoding"})
+                break
+        else:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result,
+                                    headers={"vary": "Accept-Encoding"})
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
 
 # ⚠️ IMPORTANT: Vercel function ke andar poora repo include nahi hota.
 # Is liye static mount sirf LOCAL dev par enable karen; Vercel par static pages Vercel serve karega.
 if not os.environ.get("VERCEL"):
     try:
-        app.mount("/", StaticFiles(directory=SITE_DIR, html=True), name="site")
+        app.mount("/", _SiteFiles(directory=SITE_DIR, html=True), name="site")
     except Exception:
         pass
 
+if not LAZY_STARTUP:
+    _ensure_schema()
+    templates.env  # forces the Jinja2 environment to be built now
+
+def _cli_migrate(path):
+    # brings a database file (e.g. the bundled seed) to SCHEMA_VERSION and leaves
+    # it as a single self-contained file, so cold starts can read it in place
+    eng = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=eng)
+    _migrate(eng)
+    with eng.connect() as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode = DELETE")
+    eng.dispose()
+    print(f"{path}: schema version {SCHEMA_VERSION}")
+
+def _cli_variants():
+    # (re)builds variants for every uploaded image, e.g. ones saved before this existed
+    db = SessionLocal()
+    try:
+        for table, model in (("software", Software), ("clients", Client)):
+            for item_id, url in db.query(model.id, model.image).filter(model.image.isnot(None)).all():
+                _queue_variants(table, item_id, url)
+    finally:
+        db.close()
+    _drain_jobs()
+
+def _cli_bulk(argv):
+    # bulk-import <table> <file|-> [ndjson|csv] / bulk-export <table> [ndjson|csv]
+    cmd, table = argv[0], argv[1]
+    if cmd == "bulk-export":
+        fmt = argv[2] if len(argv) > 2 else "ndjson"
+        for chunk in _bulk_export(table, fmt):
+            sys.stdout.buffer.write(chunk)
+        return
+    path = argv[2]
+    fmt = argv[3] if len(argv) > 3 else ("csv" if path.endswith(".csv") else "ndjson")
+    _ensure_schema()
+    with (open(path, "rb") if path != "-" else sys.stdin.buffer) as f:
+        report = _bulk_import(table, _bulk_rows(f, fmt))
+    print(json.dumps(report, indent=2, default=_json_default))
+
 if __name__ == "__main__":
+    if sys.argv[1:2] in (["bulk-import"], ["bulk-export"]):
+        _cli_bulk(sys.argv[1:])
+        sys.exit(0)
+    if sys.argv[1:2] == ["migrate"]:
+        _cli_migrate(sys.argv[2] if len(sys.argv) > 2 else SEED_DB)
+        sys.exit(0)
+    if sys.argv[1:2] == ["variants"]:
+        _ensure_schema()
+        _cli_variants()
+        sys.exit(0)
+    if sys.argv[1:2] == ["export"]:
+        for f in _export_static(sys.argv[2] if len(sys.argv) > 2 else None):
+            print(f"wrote {f}")
+        sys.exit(0)
     import uvicorn
     uvicorn.run("app:app", host="127.0.0.1", port=int(os.environ.get("PORT", "8000")), reload=True)
@@ -1,9 +1,17 @@
 
+// single shared request per page; 'no-cache' revalidates against the server ETag
+const softwareFeed = fetch('/api/software.json', {cache:'no-cache'}).then(r => r.ok ? r.json() : null);
+
+// srcset/sizes attributes from the feed's WebP image_variants ('' if none yet)
+function imgSrcset(x, sizes){
+  const v = (x.image_variants||[]).filter(v => v.type === 'image/webp');
+  return v.length ? ` srcset="${v.map(v => `${v.src} ${v.width}w`).join(', ')}" sizes="${sizes}"` : '';
+}
+
 (async function(){
   try{
-    const r = await fetch('/api/software.json', {cache:'no-store'});
-    if(!r.ok) return;
-    const data = await r.json();
+    const data = await softwareFeed;
+    if(!data) return;
     const all = (data.items||[]).filter(x=>x.is_active!==false);
     const esc = s=>String(s||'').replace(/[&<>"]/g, m=>({ '&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;' }[m]));
     const money = n=> n==null? '' : 'PKR '+ Number(n).toLocaleString();
@@ -23,13 +31,13 @@ if (dRoot) {
       <div class="card" style="display:grid;grid-template-columns:1.1fr .9fr;gap:24px;align-items:start;">
         <div>
           <div style="height:220px;display:flex;align-items:center;justify-content:center;background:#fff;border:1px solid rgba(2,6,23,.08);border-radius:16px;padding:10px;">
-            ${imgs.length ? `<img id="${id}_main" src="${esc(imgs[0])}" alt="${esc(x.name)}" style="max-width:100%;max-height:100%;object-fit:contain;">` : ''}
+            ${imgs.length ? `<img id="${id}_main" src="${esc(imgs[0])}"${imgSrcset(x, '(max-width: 700px) 90vw, 50vw')} alt="${esc(x.name)}" style="max-width:100%;max-height:100%;object-fit:contain;">` : ''}
           </div>
           ${imgs.length > 1 ? `
             <div style="display:flex;gap:8px;margin-top:10px;flex-wrap:wrap;">
               ${imgs.map((u,i)=>`
                 <img src="${esc(u)}" alt="" style="width:72px;height:60px;object-fit:cover;cursor:pointer;opacity:${i===0?1:.85};border:1px solid rgba(2,6,23,.1);border-radius:10px;background:#fff;"
-                     onclick="document.getElementById('${id}_main').src='${esc(u)}'">
+                     onclick="const m=document.getElementById('${id}_main');m.removeAttribute('srcset');m.src='${esc(u)}'">
               `).join('')}
             </div>
           ` : ''}
@@ -69,7 +77,7 @@ if (pRoot) {
       <div class="card price-card">
         <div class="media">
           <div class="main">
-            ${imgs.length ? `<img id="${id}_main" src="${esc(imgs[0])}" alt="${esc(x.name)}">` : ''}
+            ${imgs.length ? `<img id="${id}_main" src="${esc(imgs[0])}"${imgSrcset(x, '(max-width: 700px) 90vw, 40vw')} alt="${esc(x.name)}">` : ''}
           </div>
           ${imgs.length ? `
             <div class="thumbs">
@@ -102,7 +110,7 @@ if (pRoot) {
     img.addEventListener('click', e => {
       const t = e.currentTarget;
       const main = document.getElementById(t.dataset.target);
-      if (main) main.src = t.src;
+      if (main) { main.removeAttribute('srcset'); main.src = t.src; }
       t.parentElement.querySelectorAll('img').forEach(x => x.classList.remove('active'));
       t.classList.add('active');
     });
@@ -116,7 +124,7 @@ if (pRoot) {
       const items = all.filter(x=>x.is_free!==true);
       prodRoot.innerHTML = items.length ? items.map(x=>{
         return `<article class="card product-xxxl">
-          ${x.image?`<img class="thumb-xxxl" src="${esc(x.image)}" alt="${esc(x.name)}"/>`:''}
+          ${x.image?`<img class="thumb-xxxl" src="${esc(x.image)}"${imgSrcset(x, '(max-width: 700px) 90vw, 600px')} alt="${esc(x.name)}"/>`:''}
           <div class="meta">
             <div class="badge-soft">${esc(x.category||'Software')}</div>
             <h3>${esc(x.name)}</h3>
@@ -138,7 +146,8 @@ if (pRoot) {
   const esc = s=>String(s||'').replace(/[&<>"]/g, m=>({ '&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;' }[m]));
   const money = n=> n==null? '' : 'PKR '+ Number(n).toLocaleString();
 
-  fetch('/api/software.json',{cache:'no-store'}).then(r=>r.json()).then(data=>{
+  softwareFeed.then(data=>{
+    if(!data) return;
     const all = (data.items||[]).filter(x=>x.is_active!==false && x.is_free!==true);
     // sort desc by sort_order then id
     const paidTop = all.sort((a,b)=> (b.sort_order||0)-(a.sort_order||0) || (b.id||0)-(a.id||0)).slice(0,4);
@@ -157,7 +166,7 @@ if (pRoot) {
             </div>
           </div>
           <div class="art">
-            ${x.image?`<img class="hero-img" src="${esc(x.image)}" alt="${esc(x.name)}">`:""}
+            ${x.image?`<img class="hero-img" src="${esc(x.image)}"${imgSrcset(x, '(max-width: 700px) 90vw, 50vw')} alt="${esc(x.name)}">`:""}
           </div>
         </div>
       </article>
@@ -2,26 +2,55 @@
 document.addEventListener('DOMContentLoaded', async () => {
   const target = document.querySelector('#clients-grid');
   if (!target) return;
-  try{
-    const res = await fetch('/api/clients.json', {cache:'no-cache'});
-    const data = await res.json();
+  const filters = {industry: '', city: ''};
+  const esc = s => String(s || '').replace(/[&<>"]/g, m => ({'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;'}[m]));
+
+  function render(items){
     target.innerHTML = '';
-    if(!data.items || !data.items.length){
-      target.innerHTML = '<div class="muted">No clients added yet.</div>';
+    const shown = items.filter(c => Object.entries(filters).every(([k, v]) => !v || c[k] === v));
+    if(!shown.length){
+      target.innerHTML = `<div class="muted">${items.length ? 'No clients match these filters.' : 'No clients added yet.'}</div>`;
       return;
     }
-    for(const c of data.items){
+    for(const c of shown){
+      const webp = (c.image_variants||[]).filter(v => v.type === 'image/webp');
+      const srcset = webp.length ? ` srcset="${esc(webp.map(v => `${v.src} ${v.width}w`).join(', '))}" sizes="160px"` : '';
       const card = document.createElement('div');
       card.className = 'client-card';
       card.innerHTML = `
-        <div class="client-logo"><img src="${c.image || '/assets/img/placeholder.svg'}" alt="${c.name}"/></div>
+        <div class="client-logo"><img src="${esc(c.image || '/assets/img/placeholder.svg')}"${srcset} alt="${esc(c.name)}" loading="lazy"/></div>
         <div class="client-info">
-          <div class="client-name">${c.name}</div>
-          <div class="client-meta">${[c.industry||'', c.city||''].filter(Boolean).join(' • ')}</div>
-          ${c.website ? `<a class="btn btn-sm" href="${c.website}" target="_blank" rel="noopener">Visit</a>` : ''}
+          <div class="client-name">${esc(c.name)}</div>
+          <div class="client-meta">${esc([c.industry||'', c.city||''].filter(Boolean).join(' • '))}</div>
+          ${c.website ? `<a class="btn btn-sm" href="${esc(c.website)}" target="_blank" rel="noopener">Visit</a>` : ''}
         </div>`;
       target.appendChild(card);
     }
+  }
+
+  function facetControls(facets, items){
+    // facet counts come precomputed with the feed; filtering happens here, so the static feed works too
+    const bar = document.createElement('div');
+    bar.className = 'client-filters';
+    for(const key of Object.keys(filters)){
+      const options = (facets && facets[key]) || [];
+      if(!options.length) continue;
+      const select = document.createElement('select');
+      select.setAttribute('aria-label', `Filter by ${key}`);
+      select.add(new Option(`All ${key === 'city' ? 'cities' : 'industries'}`, ''));
+      for(const o of options) select.add(new Option(`${o.value} (${o.count})`, o.value));
+      select.addEventListener('change', () => { filters[key] = select.value; render(items); });
+      bar.appendChild(select);
+    }
+    if(bar.children.length) target.parentNode.insertBefore(bar, target);
+  }
+
+  try{
+    const res = await fetch('/api/clients.json', {cache:'no-cache'});
+    const data = await res.json();
+    const items = data.items || [];
+    facetControls(data.facets, items);
+    render(items);
   }catch(e){
     console.error('clients load error', e);
     target.innerHTML = '<div class="muted">Failed to load clients.</div>';
@@ -12,11 +12,29 @@ function card(x){
     <div class="note">${esc(x.content||'')}</div>
   </article>`;
 }
+const PAGE = 30;
 (async ()=>{
   const root=document.getElementById('rel-root');
+  let more = null;
+  function moreButton(next){
+    if(more){ more.remove(); more = null; }
+    if(!next) return;
+    more = document.createElement('button');
+    more.className = 'btn btn-outline'; more.textContent = 'Load more';
+    more.addEventListener('click', ()=>{ more.disabled = true; load(next).catch(()=>{ more.disabled = false; }); });
+    root.after(more);
+  }
+  async function load(after){
+    const data = await fetchJSON('/api/releases.json?limit='+PAGE+(after?'&after='+encodeURIComponent(after):''));
+    root.insertAdjacentHTML('beforeend', data.items.map(card).join(''));
+    moreButton(data.next);
+    return data;
+  }
+  // the exported/server-rendered page already carries the first page
+  if(root.dataset.prerendered){ moreButton(root.dataset.next); return; }
   try{
-    const data = await fetchJSON('/api/releases.json');
-    root.innerHTML = data.items.length ? data.items.map(card).join('') : '<p class="subtle">No releases yet.</p>';
+    const data = await load(null);
+    if(!data.items.length) root.innerHTML = '<p class="subtle">No releases yet.</p>';
   }catch(e){
     root.innerHTML = '<p class="subtle">Failed to load releases.</p>';
   }
@@ -0,0 +1,112 @@
+"""Synthetic data for the benchmarks: fills the app's SQLite schema at a chosen volume.
+
+The schema comes from api/app.py itself (models plus migrations), so the data
+always matches what the app expects. Generation is seeded and deterministic.
+
+    python bench/datagen.py --db /tmp/bench.db --software 1000 --releases 100000 --issues 10000 --clients 5000
+"""
+import argparse, datetime, os, random, sys, time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+CHUNK = 5000
+WORDS = ("sync report invoice ledger payroll export import backup restore printer barcode stock "
+         "branch tax dashboard audit user login crash fix improve speed memory network update").split()
+CATEGORIES = ["Accounting", "Inventory", "Payroll", "POS", "Utilities", "Education", "Healthcare"]
+INDUSTRIES = ["Retail", "Banking", "Pharma", "Textile", "Education", "Logistics", "Hospitality"]
+CITIES = ["Lahore", "Karachi", "Islamabad", "Faisalabad", "Multan", "Peshawar", "Quetta", "Sialkot"]
+
+def pct(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+def _ts(dt: datetime.datetime) -> str:
+    # the storage format SQLAlchemy's SQLite DateTime reads and compares against
+    return dt.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+def _chunks(rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= CHUNK:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def seed(m, software=1000, releases=100000, issues=10000, clients=5000, seed=42) -> dict:
+    """Insert synthetic rows through app module `m`'s writer engine; returns row counts and timing."""
+    rnd = random.Random(seed)
+    start = datetime.datetime(2020, 1, 1)
+    now = _ts(datetime.datetime(2025, 1, 1))
+
+    def text(n):
+        return " ".join(rnd.choice(WORDS) for _ in range(n))
+
+    def software_rows():
+        for i in range(software):
+            free = rnd.random() < 0.2
+            yield (f"{text(2).title()} {i}", f"product-{i}", rnd.choice(CATEGORIES), text(30),
+                   None if free else rnd.randrange(5, 500) * 1000, None if free else rnd.randrange(2, 100) * 1000,
+                   free, rnd.random() > 0.1, i, now, now)
+
+    def release_rows():
+        for i in range(releases):
+            dt = start + datetime.timedelta(minutes=rnd.randrange(0, 5 * 365 * 24 * 60))
+            yield (f"{text(4).capitalize()}", f"v{i // 100}.{i % 100}",
+                   rnd.randrange(1, software + 1) if software else None, _ts(dt),
+                   "\n".join("- " + text(8) for _ in range(rnd.randrange(2, 8))),
+                   rnd.random() > 0.05, now, now)
+
+    def issue_rows():
+        for i in range(issues):
+            yield (f"{text(5).capitalize()} #{i}", rnd.choice(["Open", "Investigating", "Fixed"]), text(40),
+                   i, rnd.random() > 0.3, now, now)
+
+    def client_rows():
+        for i in range(clients):
+            yield (f"{text(2).title()} {i}", rnd.choice(INDUSTRIES), rnd.choice(CITIES),
+                   f"https://client{i}.example.com", i % 50, rnd.random() > 0.1, now, now)
+
+    tables = [
+        ("software", "INSERT INTO software (name, slug, category, description, price_one_time, price_yearly, "
+                     "is_free, is_active, sort_order, created_at, updated_at) VALUES (?,?,?,?,?,?,?,?,?,?,?)",
+         software_rows),
+        ("release_notes", "INSERT INTO release_notes (title, version, software_id, release_date, content, "
+                          "is_published, created_at, updated_at) VALUES (?,?,?,?,?,?,?,?)", release_rows),
+        ("known_issues", "INSERT INTO known_issues (title, status, content, sort_order, is_active, created_at, "
+                         "updated_at) VALUES (?,?,?,?,?,?,?)", issue_rows),
+        ("clients", "INSERT INTO clients (name, industry, city, website, sort_order, is_active, created_at, "
+                    "updated_at) VALUES (?,?,?,?,?,?,?,?)", client_rows),
+    ]
+    m._ensure_schema()
+    t0 = time.perf_counter()
+    with m.engine.begin() as conn:
+        for _, sql, rows in tables:
+            for batch in _chunks(rows()):
+                conn.exec_driver_sql(sql, batch)
+        conn.exec_driver_sql("ANALYZE")
+    m._touch(*(name for name, _, _ in tables))
+    return {"software": software, "release_notes": releases, "known_issues": issues, "clients": clients,
+            "seconds": round(time.perf_counter() - t0, 2)}
+
+def add_args(ap):
+    ap.add_argument("--software", type=int, default=1000)
+    ap.add_argument("--releases", type=int, default=100000)
+    ap.add_argument("--issues", type=int, default=10000)
+    ap.add_argument("--clients", type=int, default=5000)
+    ap.add_argument("--seed", type=int, default=42)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--db", required=True, help="database file to create or extend")
+    add_args(ap)
+    args = ap.parse_args(argv)
+    os.environ["RUNTIME_DB"] = str(Path(args.db).resolve())
+    os.environ.setdefault("EXPORT_ON_WRITE", "0")
+    sys.path.insert(0, str(ROOT_DIR / "api"))
+    import app as m
+    print(seed(m, args.software, args.releases, args.issues, args.clients, args.seed))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Load benchmark for the public JSON routes: async (aiosqlite) vs threadpool reads.
+
+Each mode runs in a fresh interpreter (ASYNC_DB is read at import) against its
+own throwaway database, driving the app in-process through an ASGI client at
+each concurrency level. Two scenarios are measured:
+
+  hot   every request hits the same URL, i.e. the feed cache
+  miss  the feed cache is emptied before every request, so each one builds from SQLite
+
+    python bench/load.py --concurrency 50 200 1000 --requests 4000
+"""
+import argparse, asyncio, json, os, subprocess, sys, tempfile, time
+from pathlib import Path
+
+import datagen
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+PATHS = ["/api/software.json", "/api/releases.json?limit=50", "/api/known_issues.json"]
+
+async def _drive(m, concurrency: int, total: int, miss: bool) -> dict:
+    import httpx
+    latencies, errors = [], 0
+
+    async def worker(client, counter):
+        nonlocal errors
+        for i in counter:
+            path = PATHS[i % len(PATHS)]
+            if miss:
+                with m._feed_lock:
+                    m._feed_cache.clear()
+                    m._feed_cache_bytes = 0
+            t = time.perf_counter()
+            r = await client.get(path)
+            latencies.append((time.perf_counter() - t) * 1000)
+            if r.status_code != 200:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=None)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=m.app), base_url="http://bench",
+                                 limits=limits) as client:
+        warmup = iter(range(len(PATHS) * 10))
+        await asyncio.gather(*(worker(client, warmup) for _ in range(10)))
+        latencies.clear()
+        errors = 0
+        counter = iter(range(total))
+        t0 = time.perf_counter()
+        await asyncio.gather(*(worker(client, counter) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+    return {"concurrency": concurrency, "requests": total, "errors": errors,
+            "rps": round(total / elapsed, 1),
+            "p50_ms": round(datagen.pct(latencies, 50), 2), "p99_ms": round(datagen.pct(latencies, 99), 2)}
+
+def child(args):
+    sys.path.insert(0, str(ROOT_DIR / "api"))
+    import app as m
+    datagen.seed(m, args.software, args.releases, issues=0, clients=0)
+
+    async def run_all():
+        out = []
+        for scenario in ("hot", "miss"):
+            for c in args.concurrency:
+                res = await _drive(m, c, args.requests, scenario == "miss")
+                out.append(dict(res, scenario=scenario))
+        await m.dispose_async_engines()  # aiosqlite threads would keep the process alive
+        return out
+    print(json.dumps(asyncio.run(run_all())))
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--concurrency", type=int, nargs="+", default=[50, 200, 1000])
+    ap.add_argument("--requests", type=int, default=4000)
+    ap.add_argument("--software", type=int, default=200)
+    ap.add_argument("--releases", type=int, default=5000)
+    ap.add_argument("--out", help="write results JSON here as well")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+    if args.child:
+        return child(args)
+
+    results = []
+    for mode, flag in (("async", "1"), ("threadpool", "0")):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(os.environ, ASYNC_DB=flag, EXPORT_ON_WRITE="0",
+                       RUNTIME_DB=str(Path(tmp) / "app.db"))
+            cmd = [sys.executable, __file__, "--child", "--requests", str(args.requests),
+                   "--software", str(args.software), "--releases", str(args.releases),
+                   "--concurrency", *map(str, args.concurrency)]
+            out = subprocess.run(cmd, env=env, capture_output=True, text=True, check=True)
+            for row in json.loads(out.stdout.strip().splitlines()[-1]):
+                results.append(dict(row, mode=mode))
+    text = json.dumps({"benchmark": "load", "results": results}, indent=2)
+    print(text)
+    if args.out:
+        Path(args.out).write_text(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Cold-start benchmark: import of api/app.py to the first /api/software.json response.
+
+Every run is a fresh interpreter with its own empty runtime DB location, which
+is what a new serverless instance sees. Compares LAZY_STARTUP=1 with the eager
+(import-time) setup.
+
+    python bench/startup.py --runs 20
+"""
+import argparse, json, os, statistics, subprocess, sys, tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+CHILD = r"""
+import asyncio, json, sys, time
+import httpx
+t0 = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+import app as m
+t1 = time.perf_counter()
+async def first():
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=m.app), base_url="http://bench") as c:
+        r = await c.get(sys.argv[2])
+    t = time.perf_counter()
+    await m.dispose_async_engines()  # aiosqlite threads would keep the process alive
+    return r.status_code, t
+status, t2 = asyncio.run(first())
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "first_response_ms": (t2 - t1) * 1000,
+                  "total_ms": (t2 - t0) * 1000, "status": status}))
+"""
+
+def _pct(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+def run_mode(lazy: bool, runs: int, path: str) -> dict:
+    samples = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(os.environ, LAZY_STARTUP="1" if lazy else "0",
+                       RUNTIME_DB=str(Path(tmp) / "app.db"))
+            out = subprocess.run([sys.executable, "-c", CHILD, str(ROOT_DIR / "api"), path],
+                                 env=env, capture_output=True, text=True, check=True)
+            samples.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    res = {"mode": "lazy" if lazy else "eager", "runs": runs, "path": path}
+    for k in ("import_ms", "first_response_ms", "total_ms"):
+        vals = [s[k] for s in samples]
+        res[k] = {"p50": round(_pct(vals, 50), 2), "p99": round(_pct(vals, 99), 2),
+                  "mean": round(statistics.fmean(vals), 2)}
+    res["statuses"] = sorted({s["status"] for s in samples})
+    return res
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--runs", type=int, default=10)
+    ap.add_argument("--path", default="/api/software.json")
+    ap.add_argument("--out", help="write results JSON here as well")
+    args = ap.parse_args(argv)
+    results = [run_mode(True, args.runs, args.path), run_mode(False, args.runs, args.path)]
+    text = json.dumps({"benchmark": "startup", "results": results}, indent=2)
+    print(text)
+    if args.out:
+        Path(args.out).write_text(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""Benchmark suite: every public and admin route, one at a time and under concurrency.
+
+Runs in a fresh interpreter against a throwaway database filled by datagen.py,
+driving the app in-process through an ASGI client. For each route it reports
+throughput, p50/p99 latency, errors and the peak Python allocation of one
+request; the process peak RSS is reported once. Public feeds are measured both
+from the feed cache ("hot") and with the cache emptied before every request
+("miss"). --with startup/load folds in bench/startup.py and bench/load.py.
+
+    python bench/suite.py --out results.json
+    python bench/suite.py --save-baseline bench/baseline.json
+    python bench/suite.py --baseline bench/baseline.json   # exit status 1 on regression
+"""
+import argparse, asyncio, json, os, resource, subprocess, sys, tempfile, time, tracemalloc
+from pathlib import Path
+
+import datagen
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+BENCH_DIR = Path(__file__).resolve().parent
+
+# (name, method, path, form); {i} is the iteration number, {rid}/{sid}/{cid}/{job} existing ids,
+# {del} an id only the delete routes use; a str form is sent as the raw request body.
+# Every route of the app needs an entry here, or the suite refuses to run.
+PUBLIC = [
+    ("software.json", "GET", "/api/software.json", None),
+    ("releases.json", "GET", "/api/releases.json", None),
+    ("releases.json?limit", "GET", "/api/releases.json?limit=50", None),
+    ("releases.json?software_id", "GET", "/api/releases.json?software_id={sid}", None),
+    ("known_issues.json", "GET", "/api/known_issues.json", None),
+    ("clients.json", "GET", "/api/clients.json", None),
+    ("clients.json?fields", "GET", "/api/clients.json?fields=name,city&industry=Retail", None),
+    ("search.json", "GET", "/api/search.json?q=invoice", None),
+    ("changes.json", "GET", "/api/changes.json?limit=200", None),
+    ("changes.json?since", "GET", "/api/changes.json?since=2025-01-02T00:00:00", None),
+    ("changes/release_notes.json?since", "GET", "/api/changes/release_notes.json?since=2024-12-31T00:00:00&limit=100",
+     None),
+    ("releases page", "GET", "/releases", None),
+    ("releases.html", "GET", "/releases.html", None),
+]
+ADMIN = [
+    ("admin releases", "GET", "/admin/releases", None),
+    ("admin releases by software", "GET", "/admin/releases?sort=software&published=yes", None),
+    ("admin software", "GET", "/admin/software", None),
+    ("admin clients", "GET", "/admin/clients?sort=city", None),
+    ("admin home", "GET", "/admin", None),
+    ("admin login form", "GET", "/admin/login", None),
+    ("admin release form", "GET", "/admin/releases/new", None),
+    ("admin software form", "GET", "/admin/software/new", None),
+    ("admin client form", "GET", "/admin/clients/new", None),
+    ("admin release edit", "GET", "/admin/releases/{rid}/edit", None),
+    ("admin software edit", "GET", "/admin/software/{sid}/edit", None),
+    ("admin client edit", "GET", "/admin/clients/{cid}/edit", None),
+    ("admin bulk export", "GET", "/admin/bulk/known_issues/export", None),
+    ("admin bulk export software", "GET", "/admin/bulk/software/export?format=csv", None),
+    ("admin bulk export releases", "GET", "/admin/bulk/release_notes/export", None),
+    ("admin bulk export clients", "GET", "/admin/bulk/clients/export", None),
+    ("admin jobs", "GET", "/admin/jobs", None),
+    ("admin job retry", "POST", "/admin/jobs/{job}/retry", None),
+    ("metrics", "GET", "/metrics", None),
+    ("admin release create", "POST", "/admin/releases/new",
+     {"title": "Bench {i}", "version": "b{i}", "software_id": "{sid}", "content": "- bench"}),
+    ("admin release update", "POST", "/admin/releases/{rid}/edit",
+     {"title": "Bench edit {i}", "version": "e{i}", "software_id": "{sid}", "content": "- edited"}),
+    ("admin software create", "POST", "/admin/software/new",
+     {"name": "Bench {i}", "slug": "bench-{i}", "category": "Bench"}),
+    ("admin software update", "POST", "/admin/software/{sid}/edit",
+     {"name": "Bench edit {i}", "slug": "bench-edit", "category": "Bench"}),
+    ("admin client create", "POST", "/admin/clients/new", {"name": "Bench client {i}", "city": "Lahore"}),
+    ("admin client update", "POST", "/admin/clients/{cid}/edit",
+     {"name": "Bench client edit {i}", "industry": "Retail", "city": "Karachi"}),
+    ("admin bulk import", "POST", "/admin/bulk/known_issues/import?format=csv",
+     "title,status,content\nBench issue {i},Open,imported\nBench issue shared,Fixed,updated {i}\n"),
+    ("admin release delete", "POST", "/admin/releases/{del}/delete", None),
+    ("admin software delete", "POST", "/admin/software/{del}/delete", None),
+    ("admin client delete", "POST", "/admin/clients/{del}/delete", None),
+    # last, and in this order: the client ends up logged in again
+    ("admin logout", "GET", "/admin/logout", None),
+    ("admin login", "POST", "/admin/login", {"username": "{user}", "password": "{password}"}),
+]
+# routes also driven under concurrency
+CONCURRENT = {"software.json", "releases.json?limit", "known_issues.json", "search.json",
+              "admin releases", "admin software"}
+
+def _fill(s, i, ids):
+    return s.format(i=i, **{**ids, "del": ids["del"] + i})
+
+def _uncovered(m) -> list:
+    from fastapi.routing import APIRoute
+    entries = [(method, path.split("?")[0]) for _, method, path, _ in PUBLIC + ADMIN]
+    missing = []
+    for r in m.app.routes:
+        if not isinstance(r, APIRoute):  # FastAPI's docs pages and the static site mount
+            continue
+        for method in sorted(r.methods):
+            if not any(method == meth and r.path_regex.match(path) for meth, path in entries):
+                missing.append(f"{method} {r.path}")
+    return missing
+
+async def _call(client, method, path, form, i, ids):
+    url = _fill(path, i, ids)
+    if method == "GET":
+        return await client.get(url)
+    if isinstance(form, str):
+        return await client.post(url, content=_fill(form, i, ids).encode())
+    data = {k: _fill(v, i, ids) for k, v in (form or {}).items()}
+    return await client.post(url, data=data)
+
+def _bust(m):
+    # empties the feed cache, so the next public request builds from SQLite
+    def bust():
+        with m._feed_lock:
+            m._feed_cache.clear()
+            m._feed_cache_bytes = 0
+    return bust
+
+def _ok(r):
+    return r.status_code < 400
+
+async def _sequential(client, route, iterations, ids, miss):
+    name, method, path, form = route
+    counter = iter(range(10**9))
+    for _ in range(3):
+        await _call(client, method, path, form, next(counter), ids)
+    latencies, errors = [], 0
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        if miss:
+            miss()
+        t = time.perf_counter()
+        r = await _call(client, method, path, form, next(counter), ids)
+        latencies.append((time.perf_counter() - t) * 1000)
+        errors += not _ok(r)
+    elapsed = time.perf_counter() - t0
+    if miss:
+        miss()
+    tracemalloc.start()
+    await _call(client, method, path, form, next(counter), ids)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"route": name + (" (miss)" if miss else ""), "mode": "sequential", "requests": iterations,
+            "errors": errors, "rps": round(iterations / elapsed, 1),
+            "p50_ms": round(datagen.pct(latencies, 50), 2), "p99_ms": round(datagen.pct(latencies, 99), 2),
+            "alloc_peak_kb": round(peak / 1024, 1)}
+
+async def _concurrent(client, route, concurrency, total, ids, miss):
+    name, method, path, form = route
+    latencies, errors = [], 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            if miss:
+                miss()
+            t = time.perf_counter()
+            r = await _call(client, method, path, form, i, ids)
+            latencies.append((time.perf_counter() - t) * 1000)
+            errors += not _ok(r)
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+    return {"route": name + (" (miss)" if miss else ""), "mode": f"c{concurrency}", "requests": total,
+            "errors": errors, "rps": round(total / elapsed, 1),
+            "p50_ms": round(datagen.pct(latencies, 50), 2), "p99_ms": round(datagen.pct(latencies, 99), 2)}
+
+def child(args):
+    sys.path.insert(0, str(ROOT_DIR / "api"))
+    import app as m
+    import httpx
+    missing = _uncovered(m)
+    if missing:
+        raise SystemExit("routes without a benchmark entry: " + ", ".join(missing))
+    seeded = datagen.seed(m, args.software, args.releases, args.issues, args.clients, args.seed)
+    with m.engine.connect() as conn:
+        ids = {"rid": conn.exec_driver_sql("SELECT max(id) FROM release_notes").scalar() or 1,
+               "sid": conn.exec_driver_sql("SELECT max(id) FROM software").scalar() or 1,
+               "cid": conn.exec_driver_sql("SELECT max(id) FROM clients").scalar() or 1,
+               # rows the delete benchmark may remove, away from the ids the others use
+               "del": 1, "user": m.ADMIN_USER, "password": m.ADMIN_PASSWORD}
+    with m.engine.begin() as conn:
+        # a job of no known kind: every retry runs it and it fails straight back
+        ids["job"] = conn.execute(m.Job.__table__.insert().values(
+            kind="bench", status="failed", attempts=1, max_attempts=1)).inserted_primary_key[0]
+
+    async def run_all():
+        out = []
+        limits = httpx.Limits(max_connections=None)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=m.app), base_url="http://bench",
+                                     limits=limits) as client:
+            r = await client.post("/admin/login", data={"username": m.ADMIN_USER, "password": m.ADMIN_PASSWORD})
+            if r.status_code != 303:
+                raise SystemExit(f"admin login failed: {r.status_code}")
+            for route in PUBLIC + ADMIN:
+                if route[0] not in args.routes and args.routes:
+                    continue
+                out.append(await _sequential(client, route, args.iterations, ids, None))
+                if route in PUBLIC:
+                    out.append(await _sequential(client, route, args.iterations, ids, _bust(m)))
+            for route in PUBLIC + ADMIN:
+                if route[0] not in CONCURRENT or (args.routes and route[0] not in args.routes):
+                    continue
+                for c in args.concurrency:
+                    out.append(await _concurrent(client, route, c, args.requests, ids, None))
+                    if route in PUBLIC:
+                        out.append(await _concurrent(client, route, c, args.requests, ids, _bust(m)))
+        await m.dispose_async_engines()
+        return out
+    results = asyncio.run(run_all())
+    maxrss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"seed": seeded, "maxrss_mb": round(maxrss_mb, 1), "routes": results}))
+
+def _run_script(script, extra):
+    with tempfile.NamedTemporaryFile(suffix=".json") as f:
+        subprocess.run([sys.executable, str(BENCH_DIR / script), "--out", f.name, *extra],
+                       check=True, stdout=subprocess.DEVNULL)
+        return json.loads(Path(f.name).read_text())["results"]
+
+def _metrics(report) -> dict:
+    # name -> (value, higher_is_better); the numbers compared against a baseline
+    out = {}
+    for r in report.get("routes", []):
+        key = f"{r['route']} [{r['mode']}]"
+        out[key + " rps"] = (r["rps"], True)
+        out[key + " p50_ms"] = (r["p50_ms"], False)
+        out[key + " p99_ms"] = (r["p99_ms"], False)
+        out[key + " errors"] = (r["errors"], False)
+    if "maxrss_mb" in report:
+        out["maxrss_mb"] = (report["maxrss_mb"], False)
+    for r in report.get("startup", []):
+        out[f"startup {r['mode']} total_ms p50"] = (r["total_ms"]["p50"], False)
+    for r in report.get("load", []):
+        key = f"load {r['mode']} {r['scenario']} c{r['concurrency']}"
+        out[key + " rps"] = (r["rps"], True)
+        out[key + " p99_ms"] = (r["p99_ms"], False)
+    return out
+
+def compare(report, baseline, tolerance, min_ms) -> list:
+    now, base = _metrics(report), _metrics(baseline)
+    regressions = []
+    for key, (value, higher) in now.items():
+        if key not in base:
+            continue
+        ref = base[key][0]
+        if key.endswith("errors"):
+            worse = value > ref
+        elif higher:
+            # throughput: compare the amortized time per request, with the same kind of slack
+            worse = value < ref * (1 - tolerance) and (1000 / max(value, 1e-9) - 1000 / ref) > min_ms / 4
+        else:
+            # latencies also need an absolute slack so sub-millisecond noise is not a regression
+            slack = min_ms if key.endswith("_ms") or " total_ms " in key else 0
+            tol = tolerance * 2 if "p99" in key else tolerance  # tail latency is noisier
+            worse = value > ref * (1 + tol) + slack
+        if worse:
+            regressions.append({"metric": key, "baseline": ref, "current": value})
+    return regressions
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    datagen.add_args(ap)
+    ap.add_argument("--iterations", type=int, default=50, help="sequential requests per route")
+    ap.add_argument("--concurrency", type=int, nargs="+", default=[50])
+    ap.add_argument("--requests", type=int, default=1000, help="requests per concurrent run")
+    ap.add_argument("--routes", nargs="*", default=[], help="only these route names")
+    ap.add_argument("--with", dest="extra", nargs="*", default=[], choices=["startup", "load"])
+    ap.add_argument("--baseline", help="compare against this results file")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown")
+    ap.add_argument("--min-ms", type=float, default=2.0,
+                    help="allowed absolute latency slack (a quarter of it per request for throughput)")
+    ap.add_argument("--save-baseline", help="write the results here as the new baseline")
+    ap.add_argument("--out", help="write results JSON here as well")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+    if args.child:
+        return child(args)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, EXPORT_ON_WRITE="0", SLOW_QUERY_MS="1e9", N_PLUS_ONE="1000000",
+                   RUNTIME_DB=str(Path(tmp) / "app.db"))
+        cmd = [sys.executable, __file__, "--child", *(argv if argv is not None else sys.argv[1:])]
+        out = subprocess.run(cmd, env=env, capture_output=True, text=True)
+        if out.returncode:
+            sys.stderr.write(out.stderr)
+            return out.returncode
+    report = {"benchmark": "suite", "python": sys.version.split()[0], **json.loads(out.stdout.strip().splitlines()[-1])}
+    if "startup" in args.extra:
+        report["startup"] = _run_script("startup.py", ["--runs", "5"])
+    if "load" in args.extra:
+        report["load"] = _run_script("load.py", ["--concurrency", *map(str, args.concurrency),
+                                                 "--requests", str(args.requests)])
+    if args.baseline:
+        report["regressions"] = compare(report, json.loads(Path(args.baseline).read_text()),
+                                        args.tolerance, args.min_ms)
+    text = json.dumps(report, indent=2)
+    print(text)
+    for path in (args.out, args.save_baseline):
+        if path:
+            Path(path).write_text(text)
+    if report.get("regressions"):
+        for r in report["regressions"]:
+            print(f"REGRESSION {r['metric']}: {r['baseline']} -> {r['current']}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())